@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+#
+# Time a one-sentence `validate` run for each validator, to measure the startup time. The
+# baseline records the time each validator adds to the Python interpreter's startup time,
+# relative to the interpreter's startup time, so it does not depend on the machine's speed.
+# The host the baseline was recorded on is also stored, as the import times still depend on
+# the Python version.
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+validate_script = os.path.join(root_dir, 'validate')
+
+baseline_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup-baseline.json')
+
+validators = [
+    'abbreviations',
+    'contractions',
+    'form',
+    'lemma',
+    'mwt-tokens',
+    'mwt-words',
+    'pos-tags',
+    'sentence-text',
+    'split-sentences',
+    'all',
+]
+
+sentence = """# sent_id = startup-1
+# text = The cats sat.
+1\tThe\tthe\tDET\tDT\tDefinite=Def|PronType=Art\t2\tdet\t_\t_
+2\tcats\tcat\tNOUN\tNNS\tNumber=Plur\t3\tnsubj\t_\t_
+3\tsat\tsit\tVERB\tVBD\tMood=Ind|Tense=Past|VerbForm=Fin\t0\troot\t_\tSpaceAfter=No
+4\t.\t.\tPUNCT\t.\t_\t3\tpunct\t_\t_
+
+"""
+
+
+def cpu_time():
+    # The CPU time of the finished child processes is less affected by the other processes
+    # on the machine than the elapsed time.
+    if resource is None:
+        return time.perf_counter()
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_time(command):
+    start = cpu_time()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=root_dir)
+    return cpu_time() - start
+
+
+def fastest_time(command, runs):
+    # The fastest run is the least affected by the other processes on the machine.
+    run_time(command)  # warm up the file system and rule caches
+    return min(run_time(command) for _ in range(runs))
+
+
+def measure(filename, runs):
+    interpreter = fastest_time([sys.executable, '-c', 'pass'], runs)
+    times = {}
+    for name in validators:
+        times[name] = fastest_time([sys.executable, validate_script, '--validator', name, filename], runs)
+    return interpreter, times
+
+
+def host_info():
+    return {
+        'python': f"{platform.python_implementation()} {platform.python_version()}",
+        'system': f"{platform.system()} {platform.release()}",
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def relative_times(interpreter, times):
+    # The time each validator adds to the interpreter's startup time, in interpreter startup times.
+    return {name: (seconds - interpreter) / interpreter for name, seconds in times.items()}
+
+
+def compare(results, baseline, tolerance):
+    failures = []
+    for name, relative in results['validators'].items():
+        if name not in baseline['validators']:
+            continue
+        ratio = relative / baseline['validators'][name]
+        status = 'ok' if ratio <= 1 + tolerance else 'SLOWER'
+        print(f"{name:<16} {relative:>8.2f} {baseline['validators'][name]:>9.2f} {ratio:>6.2f}x  {status}")
+        if status != 'ok':
+            failures.append(name)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time a one-sentence validate run for each validator.')
+    parser.add_argument('--runs', default=20, type=int,
+                        help='The number of runs to take the fastest time of.')
+    parser.add_argument('--baseline', default=baseline_filename, type=str,
+                        help='The baseline times to compare to.')
+    parser.add_argument('--tolerance', default=0.2, type=float,
+                        help='The fraction a validator can be slower than the baseline.')
+    parser.add_argument('--save', action='store_true',
+                        help='Write the times to the baseline file instead of comparing them.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filename = os.path.join(temp_dir, 'startup.conllu')
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(sentence)
+        interpreter, times = measure(filename, args.runs)
+
+    results = {
+        'host': host_info(),
+        'interpreter_seconds': interpreter,
+        'validators': relative_times(interpreter, times),
+    }
+    print(f"{'interpreter':<16} {interpreter * 1000:>8.1f} ms")
+    for name, seconds in times.items():
+        print(f"{name:<16} {seconds * 1000:>8.1f} ms")
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        return
+
+    if not os.path.exists(args.baseline):
+        return
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    print()
+    if baseline['host']['python'] != results['host']['python']:
+        print(f"The baseline was recorded with {baseline['host']['python']}, so the import times may differ.")
+    print(f"{'validator':<16} {'startup':>8} {'baseline':>9} {'ratio':>7}")
+    if len(compare(results, baseline, args.tolerance)) != 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
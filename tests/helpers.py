@@ -0,0 +1,45 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import importlib.machinery
+import importlib.util
+import os
+import subprocess
+import sys
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+data_dir = os.path.join(root_dir, 'tests', 'data')
+
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+readers = ['conllu', 'native', 'mmap']
+
+
+def data_file(filename):
+    return os.path.join(data_dir, filename)
+
+
+def validate(*args, env=None):
+    # Run the validate script, returning the CompletedProcess with the stdout and stderr text.
+    command = [sys.executable, os.path.join(root_dir, 'validate')] + list(args)
+    environ = None if env is None else dict(os.environ, **env)
+    return subprocess.run(command, cwd=root_dir, capture_output=True, text=True, env=environ)
+
+
+def load_validate():
+    # The validate script as a module, to call its functions. It is added to sys.modules, so
+    # the parallel jobs can pickle its functions.
+    if 'validate_script' in sys.modules:
+        return sys.modules['validate_script']
+    filename = os.path.join(root_dir, 'validate')
+    loader = importlib.machinery.SourceFileLoader('validate_script', filename)
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+def parse_validate_args(validate_module, *args):
+    parser = validate_module.build_argparse()
+    return validate_module.load_config(parser, parser.parse_args(list(args)))
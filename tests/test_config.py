@@ -0,0 +1,69 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+
+from helpers import data_file, validate
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def validate(self, config, *args):
+        filename = os.path.join(self.temp_dir.name, 'validator.toml')
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(config)
+        # The project rule caches are written to the user's cache directory.
+        env = {'XDG_CACHE_HOME': os.path.join(self.temp_dir.name, 'cache')}
+        return validate('--validator', 'all', '--config', filename, *args, data_file('corpus.conllu'), env=env)
+
+    def assertConfigError(self, config, message, *args):
+        result = self.validate(config, *args)
+        self.assertEqual(result.returncode, 2)
+        self.assertEqual(result.stdout, '')
+        self.assertIn(message, result.stderr)
+
+    def test_config_errors(self):
+        self.assertConfigError('disable = "lemma"\n', "option 'disable' in ")
+        self.assertConfigError('disable = ["no-such-rule"]\n', "unknown rule or validator 'no-such-rule'")
+        self.assertConfigError('level = 1\n', "option 'level' in ")
+        self.assertConfigError('level = "fatal"\n', "unknown log level 'fatal'")
+        self.assertConfigError('rule-packs = "proj.toml"\n', "option 'rule-packs' in ")
+        self.assertConfigError('no-such-option = 1\n', "unknown option 'no-such-option'")
+        self.assertConfigError('disable = [\n', 'cannot read the configuration file')
+        self.assertConfigError('', "unknown rule or validator 'no-such-rule'", '--disable', 'no-such-rule')
+
+    def test_missing_config(self):
+        result = validate('--config', os.path.join(self.temp_dir.name, 'missing.toml'), data_file('corpus.conllu'))
+        self.assertEqual(result.returncode, 2)
+        self.assertIn('cannot read the configuration file', result.stderr)
+
+    def test_disabled_validator(self):
+        result = self.validate('disable = ["lemma", "unknown-xpos"]\nlevel = "ERROR"\n')
+        self.assertEqual(result.stderr, '')
+        self.assertNotEqual(result.stdout, '')
+        self.assertNotIn('lemma', result.stdout)
+        self.assertNotIn('WARN', result.stdout)
+        self.assertIn('ERROR', result.stdout)
+
+    def test_options_override_config(self):
+        result = self.validate('level = "ERROR"\n', '--level', 'WARN')
+        self.assertEqual(result.stderr, '')
+        self.assertIn('WARN', result.stdout)
+
+    def test_rule_packs(self):
+        # The rule packs are relative to the configuration file.
+        with open(os.path.join(self.temp_dir.name, 'project.toml'), 'w', encoding='utf-8') as f:
+            f.write('[lemma-exceptions."NNS/Number=Plur"]\ncats = "cats"\n')
+        expected = self.validate('')
+        self.assertIn("Sentence doc1-s2 token 2 -- NNS/Number=Plur lemma 'cats' does not match", expected.stdout)
+        result = self.validate('rule-packs = ["project.toml"]\n')
+        self.assertEqual(result.stderr, '')
+        self.assertNotIn("Sentence doc1-s2 token 2 -- NNS/Number=Plur lemma 'cats'", result.stdout)
+        self.assertIn("Sentence doc3-s1 token 9 -- NNS/Number=Plur lemma 'cat' does not match", result.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
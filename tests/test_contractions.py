@@ -0,0 +1,50 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import helpers  # noqa: F401 -- adds the validator package to the path
+from validator import rulepacks
+from validator.contractions import ContractionValidator
+
+rulepacks.load_rule_packs()
+
+words = [
+    '', 'a', 'I', 'be', 'do', 'go', 'the', 'it', 'in', 'an', 'em', 'x', 'goin', "goin'", 'walkin’', "an'", "in'",
+    "'em", '’em', 'bout', "'bout", 'fore', "'twas", 'twill', "'twill", "don't", "they're", "we'll", "I'm", "she's",
+    "James'", "rock'n'roll", "'s", "'", '’', "''", "'in", 'ing', '1', "1'",
+]
+
+
+def joined_contraction(prev_form, form):
+    # The split contraction check on the joined forms, as it was before the split index.
+    form = (prev_form + form).replace('’', '\'')
+    if '\'' not in form:
+        return False
+    if form.endswith('in\'') and form[0].isalpha():  # -in' -> ing
+        return True
+    return form.lower() in [contraction.replace('’', '\'').lower()
+                            for contraction in rulepacks.dialectal_contractions]
+
+
+class TestContractionSplitIndex(unittest.TestCase):
+    def test_split_pairs(self):
+        # Each split of the contractions and their apostrophe variants, with the other words.
+        forms = set(words)
+        for contraction in rulepacks.dialectal_contractions:
+            for variant in rulepacks.apostrophe_variants(contraction.replace('’', '\'')):
+                for i in range(len(variant) + 1):
+                    forms.add(variant[:i])
+                    forms.add(variant[i:])
+                    forms.add(variant[:i].upper())
+                    forms.add(variant[i:].capitalize())
+        forms = sorted(forms)
+        for prev_form in forms:
+            for form in forms:
+                if prev_form == '' and form == '':
+                    continue
+                self.assertEqual(ContractionValidator.is_contraction(prev_form, form),
+                                 joined_contraction(prev_form, form), (prev_form, form))
+
+
+if __name__ == '__main__':
+    unittest.main()
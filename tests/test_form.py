@@ -0,0 +1,80 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import sys
+import unicodedata
+import unittest
+
+import helpers  # noqa: F401 -- adds the validator package to the path
+from validator import form
+from validator.form import CharacterClass, number_form, RE_CARDINAL, RE_CARDINAL_DIGITS, RE_FRACTIONAL_DIGITS, \
+    RE_ORDINAL_COMBINED, RE_ROMAN_DIGITS, SYMBOL_CHARACTER, WORD_CHARACTER
+
+
+def is_symbol_character(c):
+    # The symbol form characters, as they were matched before the character sets were cached.
+    return unicodedata.category(c) in ['Po', 'Sc', 'Sk', 'Sm', 'So']
+
+
+def is_word_character(c):
+    # The word form characters, as they were matched before the character sets were cached.
+    return unicodedata.category(c) in ['Ll', 'Lt', 'Lu', 'Lm'] or c in "'-.’"
+
+
+def sequential_number_form(value):
+    # The number forms matched one at a time, as they were before they were combined into one regex.
+    for name, regex in [
+        ('Digit', RE_CARDINAL_DIGITS),
+        ('Combi', RE_ORDINAL_COMBINED),
+        ('Frac', RE_FRACTIONAL_DIGITS),
+        ('Roman', RE_ROMAN_DIGITS),
+        ('Other', RE_CARDINAL),
+    ]:
+        if regex.fullmatch(value):
+            return name
+    return None
+
+
+class TestCharacterClass(unittest.TestCase):
+    def assertSameMembers(self, characters, is_member):
+        characters = CharacterClass(characters.flag)
+        code_points = [chr(code) for code in range(sys.maxunicode + 1)]
+        expected = [c for c in code_points if is_member(c)]
+        self.assertEqual([c for c in code_points if characters.all_members(c)], expected)
+        # The characters are classified from the cached members and non-members the second time.
+        self.assertEqual([c for c in code_points if characters.all_members(c)], expected)
+        self.assertEqual(len(characters.members) + len(characters.non_members), sys.maxunicode + 1)
+
+    def test_symbol_characters(self):
+        self.assertEqual(form.symbol_characters.flag, SYMBOL_CHARACTER)
+        self.assertSameMembers(form.symbol_characters, is_symbol_character)
+
+    def test_word_characters(self):
+        self.assertEqual(form.word_characters.flag, WORD_CHARACTER)
+        self.assertSameMembers(form.word_characters, is_word_character)
+
+    def test_forms(self):
+        forms = [
+            '', 'a', 'don\'t', 'rock-n-roll', 'U.S.', 'it’s', 'naïve', 'Ǆemal', 'ʼ', 'a1', 'a b', 'a_b',
+            '!', '?!', '$', '€', '£5', '+', '≤', '©', '^', '…', '%', '(', '«', '—', '\U0001F600', 'a\U0001F600',
+        ]
+        for characters, is_member in [(form.symbol_characters, is_symbol_character),
+                                       (form.word_characters, is_word_character)]:
+            characters = CharacterClass(characters.flag)
+            for value in forms + forms:
+                with self.subTest(flag=characters.flag, form=value):
+                    self.assertEqual(characters.all_members(value), all(is_member(c) for c in value))
+
+
+class TestNumberForm(unittest.TestCase):
+    def test_number_forms(self):
+        forms = [
+            '', '0', '7', '42', '+44', '1,000', '1-2', "'90", '’90', '#1', '3:30', '1/2', '1st', '2nd', '3rd', '4th',
+            '11th', '12TH', '13th', '21st', '22ND', '101st', '1,000th', '1.25', '.50', '½', '⅓', '↉', 'I', 'iv', 'XIV',
+            'MCMXCIX', 'mmxxiv', 'IIII', 'VX', '2x', '3D', '10am', '4G', '1a1', 'a1', 'one', 'first', '1.2.3', '1st\n',
+        ]
+        for value in forms:
+            self.assertEqual(number_form(value), sequential_number_form(value), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
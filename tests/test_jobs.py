@@ -0,0 +1,84 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import collections
+import io
+import json
+import unittest
+from unittest import mock
+
+from helpers import data_file, load_validate, parse_validate_args, readers, validate
+
+
+class TestJobs(unittest.TestCase):
+    # The parallel jobs report the same diagnostics, in the same order, as a single job. This
+    # includes the checks spanning files or batches, e.g. split sentences and language changes.
+
+    def assertSameOutput(self, serial_args, parallel_args):
+        for reader in readers:
+            with self.subTest(reader=reader):
+                expected = validate('--reader', reader, *serial_args)
+                actual = validate('--reader', reader, *parallel_args)
+                self.assertEqual(expected.stderr, '')
+                self.assertEqual(actual.stderr, '')
+                self.assertNotEqual(expected.stdout, '')
+                self.assertEqual(actual.stdout, expected.stdout)
+                self.assertEqual(actual.returncode, expected.returncode)
+
+    def test_file_list(self):
+        self.assertSameOutput(['--validator', 'all', '--jobs', '1', data_file('corpus.lst')],
+                              ['--validator', 'all', '--jobs', '3', data_file('corpus.lst')])
+
+    def test_file_list_matches_single_file(self):
+        self.assertSameOutput(['--validator', 'all', data_file('corpus.conllu')],
+                              ['--validator', 'all', '--jobs', '2', data_file('corpus.lst')])
+
+    def test_file_batches(self):
+        for batch_size in ['1', '2', '3']:
+            with self.subTest(batch_size=batch_size):
+                self.assertSameOutput(['--validator', 'all', '--jobs', '1', data_file('corpus.conllu')],
+                                      ['--validator', 'all', '--jobs', '2', '--batch-size', batch_size,
+                                       data_file('corpus.conllu')])
+
+    def test_invalid_batch_size(self):
+        for batch_size in ['0', '-1', 'x']:
+            with self.subTest(batch_size=batch_size):
+                result = validate('--jobs', '2', '--batch-size', batch_size, data_file('corpus.conllu'))
+                self.assertEqual(result.returncode, 2)
+                self.assertIn(f"invalid positive integer '{batch_size}'", result.stderr)
+
+    def test_jsonl_output(self):
+        self.assertSameOutput(['--validator', 'all', '--format', 'jsonl', data_file('corpus.lst')],
+                              ['--validator', 'all', '--format', 'jsonl', '--jobs', '3', data_file('corpus.lst')])
+
+
+class TestJobCounts(unittest.TestCase):
+    # The counts of the diagnostics from the jobs are added to the main run context.
+
+    def run_counts(self, *args):
+        validate_module = load_validate()
+        args = parse_validate_args(validate_module, '--validator', 'all', '--format', 'jsonl', *args)
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            context = validate_module.validate_files(args.input, args)
+        diagnostics = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        expected = collections.Counter((d['level'], d['validator'], d['rule']) for d in diagnostics)
+        self.assertEqual(context.counts, expected)
+        return context
+
+    def test_counts(self):
+        expected = self.run_counts(data_file('corpus.conllu'))
+        self.assertNotEqual(expected.error_count(), 0)
+        self.assertNotEqual(expected.warning_count(), 0)
+        for args in [
+            ['--jobs', '2', data_file('corpus.lst')],
+            ['--jobs', '2', '--batch-size', '2', data_file('corpus.conllu')],
+        ]:
+            with self.subTest(args=args):
+                context = self.run_counts(*args)
+                self.assertEqual(context.counts, expected.counts)
+                for level in ['ERROR', 'WARN']:
+                    self.assertEqual(context.count_by_validator(level), expected.count_by_validator(level))
+                    self.assertEqual(context.count_by_rule(level), expected.count_by_rule(level))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from helpers import data_file, load_validate, parse_validate_args, validate
+from validator import lemma
+from validator import logger
+from validator import rulepacks
+
+rulepacks.load_rule_packs()
+
+words = [
+    '', 'a', 'I', 'be', 'do', 'go', 'the', 'cats', 'bus', 'buses', 'boxes', 'flies', 'ladies', 'wolves', 'knives',
+    'children', 'mice', 'geese', 'oxen', 'data', 'analyses', 'cacti', 'bigger', 'biggest', 'happier', 'happiest',
+    'larger', 'largest', 'faster', 'fastest', 'freer', 'freest', 'stopped', 'stopping', 'tried', 'trying', 'dying',
+    'lied', 'agreed', 'seeing', 'making', 'taking', 'panicked', 'panicking', 'picnicked', 'goes', 'does', 'has',
+    'watches', 'fixes', 'buzzes', 'quizzes', 'played', 'plays', 'studied', 'studies', 'ran', 'running', 'eaten',
+    'CATS', 'Boxes', 'STOPPED', 'Running', 'e-mailed', 'co-ordinated', "rock'n'roll", 'x', 'ss', 'ies', 'es',
+    'ing', 'ed', 'er', 'est', "goin'", "walkin’", 'ves', 'zzes', 'cked',
+]
+
+
+def rule_pack_forms():
+    # The words, and the forms and lemmas of the lemma exceptions.
+    forms = set(words)
+    for exceptions in rulepacks.lemma_exceptions.values():
+        for form, lemmas in exceptions.items():
+            forms.add(form)
+            forms.update(lemmas if isinstance(lemmas, list) else [lemmas])
+    return sorted(forms)
+
+
+def linear_stem(rules, form):
+    # The stemming rules applied in order, as they were before they were compiled into a trie.
+    for ending, replacement in rules:
+        if isinstance(ending, re.Pattern):
+            stem, count = ending.subn(replacement, form)
+            if count != 0:
+                return stem
+        elif form.endswith(ending):
+            return form[:-len(ending)] + replacement
+    return form
+
+
+def iter_nodes(node):
+    yield node
+    for child in node.children.values():
+        yield from iter_nodes(child)
+
+
+class TestStemmingRules(unittest.TestCase):
+    def test_rule_order(self):
+        forms = rule_pack_forms()
+        for name, rules in vars(lemma).items():
+            if not isinstance(rules, lemma.StemmingRules):
+                continue
+            with self.subTest(rules=name):
+                for form in forms:
+                    self.assertEqual(rules.stem(form), linear_stem(rules.rules, form), form)
+
+    def test_string_ending_hides_later_rules(self):
+        rules = lemma.StemmingRules([
+            (re.compile('(ie)s$'), '\\1'),
+            ('s', ''),
+            (re.compile('(x)es$'), '\\1'),
+        ])
+        for form in ['flies', 'boxes', 'cats', 'cat', 'ies', 's']:
+            self.assertEqual(rules.stem(form), linear_stem(rules.rules, form), form)
+
+    def test_lazy_compile(self):
+        # The node regexes are compiled when the node is first used.
+        rules = lemma.StemmingRules([(re.compile('([^aeiou])ies$'), '\\1y'), ('s', '')])
+        self.assertFalse(any(node.compiled for node in iter_nodes(rules.root)))
+        self.assertEqual(rules.stem('flies'), 'fly')
+        compiled = [node for node in iter_nodes(rules.root) if node.compiled]
+        self.assertEqual(len(compiled), 1)
+        self.assertEqual(rules.stem('flies'), 'fly')
+        self.assertEqual(rules.stem('cats'), 'cat')
+
+    def test_invalid_patterns(self):
+        self.assertRaises(ValueError, lemma.StemmingRules, [(re.compile('(?P<end>s)$'), '')])
+        self.assertRaises(ValueError, lemma.StemmingRules, [(re.compile('s$', re.IGNORECASE), '')])
+
+
+class TestLemmaCache(unittest.TestCase):
+    def create_validator(self, *args):
+        validate_module = load_validate()
+        args = parse_validate_args(validate_module, '--validator', 'lemma', *args, data_file('corpus.conllu'))
+        return validate_module.create_validators(args)[0]
+
+    def validate_corpus(self, validator):
+        with logger.run_context(logger.CollectorSink()):
+            load_validate().validate_conllu(data_file('corpus.conllu'), 'en', [validator])
+
+    def test_cache_size(self):
+        self.assertEqual(self.create_validator().cache_info().maxsize, 65536)
+        self.assertEqual(self.create_validator('--lemma-cache-size', '3').cache_info().maxsize, 3)
+        self.assertEqual(self.create_validator('--lemma-cache-size', '0').cache_info().maxsize, 0)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'validator.toml')
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write('lemma-cache-size = 5\n')
+            self.assertEqual(self.create_validator('--config', filename).cache_info().maxsize, 5)
+            # The command-line option takes precedence over the configuration file.
+            self.assertEqual(self.create_validator('--config', filename, '--lemma-cache-size', '7')
+                             .cache_info().maxsize, 7)
+
+    def test_invalid_cache_size(self):
+        result = validate('--lemma-cache-size', '-1', data_file('corpus.conllu'))
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("invalid non-negative integer '-1'", result.stderr)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'validator.toml')
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write('lemma-cache-size = -1\n')
+            result = validate('--config', filename, data_file('corpus.conllu'))
+            self.assertEqual(result.returncode, 2)
+            self.assertIn("option 'lemma-cache-size' in ", result.stderr)
+
+    def test_hits_and_misses(self):
+        with mock.patch.object(lemma, 'expected_lemma', wraps=lemma.expected_lemma) as expected_lemma:
+            validator = self.create_validator()
+            self.validate_corpus(validator)
+        calls = [call.args for call in expected_lemma.call_args_list]
+        info = validator.cache_info()
+        self.assertEqual(info.misses, len(calls))
+        self.assertEqual(len(set(calls)), len(calls))
+        self.assertGreater(info.hits, 0)
+        lookups = info.hits + info.misses
+        # The second time, every lemma is in the cache.
+        self.validate_corpus(validator)
+        self.assertEqual(validator.cache_info().hits, info.hits + lookups)
+        self.assertEqual(validator.cache_info().misses, info.misses)
+
+    def test_no_cache(self):
+        with mock.patch.object(lemma, 'expected_lemma', wraps=lemma.expected_lemma) as expected_lemma:
+            validator = self.create_validator('--lemma-cache-size', '0')
+            self.validate_corpus(validator)
+        info = validator.cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, expected_lemma.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import contextvars
+import io
+import json
+import threading
+import unittest
+from unittest import mock
+
+import helpers  # noqa: F401 -- adds the validator package to the path
+from validator import logger
+from validator.logger import Diagnostic, LogLevel
+
+
+def diagnostic(sent_id='s1', token_id=2, expect=None, actual='x'):
+    return Diagnostic(LogLevel.ERROR, sent_id, token_id, 'form', 'invalid-form', "invalid form '{actual}'",
+                      expect=expect, actual=actual)
+
+
+class TestSinks(unittest.TestCase):
+    def test_text_format(self):
+        stream = io.StringIO()
+        sink = logger.TextSink(stream)
+        sink.emit(diagnostic())
+        sink.emit(diagnostic(token_id=None))
+        sink.emit(diagnostic(token_id=(1, '-', 2)))
+        self.assertEqual(stream.getvalue(),
+                         "ERROR: Sentence s1 token 2 -- invalid form 'x'\n"
+                         "ERROR: Sentence s1 -- invalid form 'x'\n"
+                         "ERROR: Sentence s1 token 1-2 -- invalid form 'x'\n")
+
+    def test_jsonl_format(self):
+        stream = io.StringIO()
+        sink = logger.JsonLinesSink(stream)
+        sink.emit(diagnostic(token_id=(8, '.', 1), expect='y'))
+        self.assertEqual(json.loads(stream.getvalue()), {
+            'level': 'ERROR', 'sent_id': 's1', 'token_id': '8.1', 'validator': 'form', 'rule': 'invalid-form',
+            'message': "invalid form 'x'", 'expect': 'y', 'actual': 'x',
+        })
+
+    def test_unbuffered_by_default(self):
+        stream = io.StringIO()
+        sink = logger.TextSink(stream)
+        sink.emit(diagnostic())
+        self.assertNotEqual(stream.getvalue(), '')
+
+    def test_buffered(self):
+        stream = io.StringIO()
+        sink = logger.TextSink(stream, buffer_size=3)
+        sink.emit(diagnostic())
+        sink.emit(diagnostic())
+        self.assertEqual(stream.getvalue(), '')
+        sink.emit(diagnostic())
+        self.assertEqual(len(stream.getvalue().splitlines()), 3)
+        sink.emit(diagnostic())
+        sink.flush()
+        self.assertEqual(len(stream.getvalue().splitlines()), 4)
+
+    def test_run_context_flush(self):
+        stream = io.StringIO()
+        with logger.run_context(logger.TextSink(stream, buffer_size=256)) as context:
+            context.emit(diagnostic())
+            self.assertEqual(stream.getvalue(), '')
+        self.assertEqual(len(stream.getvalue().splitlines()), 1)
+
+    def test_format_is_abstract(self):
+        class Sink(logger.BufferedSink):
+            pass
+        self.assertRaises(TypeError, Sink)
+
+
+class Sentence:
+    def __init__(self, sent_id):
+        self.metadata = {'sent_id': sent_id}
+
+
+class TestRunContext(unittest.TestCase):
+    def test_default_context(self):
+        # The diagnostics logged outside of a run context are written without being flushed.
+        def log_diagnostics():
+            for i in range(300):
+                logger.log(LogLevel.ERROR, Sentence(f"s{i}"), None, 'message {n}', n=i)
+            return logger.get_context()
+
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            context = contextvars.Context().run(log_diagnostics)
+            lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 300)
+        self.assertEqual(lines[-1], 'ERROR: Sentence s299 -- message 299')
+        self.assertEqual(context.error_count(), 300)
+
+    def test_counts(self):
+        with logger.run_context(logger.CollectorSink(), logger.Filter(disabled_rules=['b'])) as context:
+            context.validator = 'x'
+            logger.log(LogLevel.ERROR, Sentence('s1'), None, 'a', rule='a')
+            logger.log(LogLevel.ERROR, Sentence('s1'), None, 'b', rule='b')
+            logger.log(LogLevel.WARN, Sentence('s1'), None, 'c', rule='c')
+            context.validator = 'y'
+            logger.log(LogLevel.ERROR, Sentence('s2'), None, 'a', rule='a')
+            context.merge({(LogLevel.WARN, 'y', 'c'): 2})
+        self.assertEqual(context.error_count(), 2)
+        self.assertEqual(context.warning_count(), 3)
+        self.assertEqual(context.count_by_validator(LogLevel.ERROR), {'x': 1, 'y': 1})
+        self.assertEqual(context.count_by_rule(LogLevel.WARN), {'c': 3})
+        self.assertEqual(len(context.sink.diagnostics), 3)
+
+    def test_threads(self):
+        # The sink is written to under the lock, so the lines from the threads are not mixed.
+        stream = io.StringIO()
+        with logger.run_context(logger.TextSink(stream, buffer_size=7)):
+            def log_diagnostics(n):
+                for i in range(500):
+                    logger.log(LogLevel.ERROR, Sentence(f"t{n}"), None, 'message {i}', i=i)
+            threads = [threading.Thread(target=contextvars.copy_context().run, args=(log_diagnostics, n))
+                       for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 4000)
+        for n in range(8):
+            self.assertEqual([line for line in lines if line.startswith(f"ERROR: Sentence t{n} ")],
+                             [f"ERROR: Sentence t{n} -- message {i}" for i in range(500)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from helpers import readers
+from validator import conllutil
+from validator import logger
+from validator import rulepacks
+from validator.mwt import MwtSuffixIndex, MwtWordValidator, suffix_variants
+
+rulepacks.load_rule_packs()
+
+sentence = """# sent_id = mwt-1
+# text = don't xyz
+1-2\tdon't\t_\t_\t_\t_\t_\t_\t_\t_
+1\tdo\tdo\tAUX\tVBP\t_\t0\troot\t_\t_
+2\tn't\tnot\tPART\tRB\t_\t1\tadvmod\t_\t_
+3-4\txyz\t_\t_\t_\t_\t_\t_\t_\t_
+3\txy\txy\tX\tFW\t_\t1\tdep\t_\t_
+4\tz\tz\tX\tFW\t_\t3\tdep\t_\t_
+"""
+
+
+def match_suffix(form):
+    # The MWT suffixes matched in order, as they were before they were indexed.
+    for priority, suffix in enumerate(rulepacks.mwt_suffixes.keys()):
+        for variant, _, _ in suffix_variants(suffix):
+            if form.endswith(variant):
+                return priority, variant
+    return None
+
+
+class TestMwtSuffixIndex(unittest.TestCase):
+    def test_suffix_order(self):
+        index = MwtSuffixIndex(rulepacks.mwt_suffixes)
+        forms = {'', 'a', 'I', 'it', 'cats', "'", '’', "James'", "rock'n'roll"}
+        for suffix, bases in rulepacks.mwt_suffixes.items():
+            for variant, _, _ in suffix_variants(suffix):
+                forms.add(variant)
+                forms.add(variant[1:])
+                for base_form in list(bases.keys())[:5] + ['it', 'John', 'JOHN']:
+                    forms.add((base_form or 'x') + variant)
+        for form in sorted(forms):
+            match = index.match(form)
+            self.assertEqual(None if match is None else match[:2], match_suffix(form), form)
+
+
+class TestMwtWordValidator(unittest.TestCase):
+    def test_unknown_mwt_form(self):
+        # The state of the previous multi-word token is reset for an unknown form, so its
+        # words are not checked against the previous token's parts.
+        for reader in readers:
+            with self.subTest(reader=reader):
+                sent = conllutil.parse_sentence_block(sentence, reader)
+                validator = MwtWordValidator('en')
+                with logger.run_context(logger.CollectorSink()) as context:
+                    validator.validate_sentence(sent)
+                self.assertEqual([(d.token_id, d.rule) for d in context.sink.diagnostics],
+                                 [((3, '-', 4), 'unknown-mwt-form')])
+                self.assertEqual(validator.parts, ())
+                self.assertEqual(validator.part_index, -1)
+                self.assertIsNone(validator.mwt_form)
+                self.assertFalse(hasattr(validator, 'index'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+
+from helpers import data_file, readers, validate
+from validator import conllutil
+from validator import logger
+from validator.pos import PosTagValidator
+
+sentence = """# sent_id = pos-1
+# text = Das ist gut.
+1\tDas\tder\tPRON\tPDS\t_\t3\tnsubj\t_\t_
+2\tist\tsein\tAUX\tVAFIN\t_\t3\tcop\t_\t_
+3\tgut\tgut\tADJ\tADJD\t_\t0\troot\t_\tSpaceAfter=No
+4\t.\t.\tPUNCT\t$.\t_\t3\tpunct\t_\t_
+"""
+
+# The German (STTS) XPOS values in corpus.conllu, which are not Penn TreeBank tags.
+stts_errors = [
+    "ERROR: Sentence doc2-s1 token 1 -- unknown XPOS value 'PDS'",
+    "ERROR: Sentence doc2-s1 token 2 -- unknown XPOS value 'VAFIN'",
+    "ERROR: Sentence doc2-s1 token 3 -- unknown XPOS value 'ADJA'",
+    "ERROR: Sentence doc2-s1 token 4 -- unknown XPOS value 'ADJD'",
+]
+
+
+class TestPosTagValidator(unittest.TestCase):
+    def unknown_xpos(self, language, **kwargs):
+        values = []
+        for reader in readers:
+            sent = conllutil.parse_sentence_block(sentence, reader)
+            with logger.run_context(logger.CollectorSink()) as context:
+                PosTagValidator(language, **kwargs).validate_sentence(sent)
+            values.append([d.actual for d in context.sink.diagnostics if d.rule == 'unknown-xpos'])
+        self.assertEqual(values[1:], values[:-1])  # the same for each reader
+        return values[0]
+
+    def test_language_tagset(self):
+        self.assertEqual(self.unknown_xpos('en'), ['PDS', 'VAFIN', 'ADJD', '$.'])
+        self.assertEqual(self.unknown_xpos('de'), [])
+
+    def test_selected_tagset(self):
+        self.assertEqual(self.unknown_xpos('de', xpos_tagset='penn'), ['PDS', 'VAFIN', 'ADJD', '$.'])
+        self.assertEqual(self.unknown_xpos('und', xpos_tagset='penn'), ['PDS', 'VAFIN', 'ADJD', '$.'])
+
+    def test_selected_tagset_is_kept(self):
+        validator = PosTagValidator('en', xpos_tagset='penn')
+        penn = validator.xpos_values
+        validator.switch_language('de')
+        self.assertIs(validator.xpos_values, penn)
+
+
+class TestXposTagsetOption(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        # The project rule caches are written to the user's cache directory.
+        self.env = {'XDG_CACHE_HOME': os.path.join(self.temp_dir.name, 'cache')}
+
+    def write_file(self, filename, text):
+        filename = os.path.join(self.temp_dir.name, filename)
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return filename
+
+    def validate(self, *args):
+        return validate('--validator', 'pos-tags', *args, data_file('corpus.conllu'), env=self.env)
+
+    def test_default_tagset(self):
+        result = self.validate()
+        self.assertEqual(result.stderr, '')
+        self.assertEqual(result.stdout, '')
+
+    def test_option(self):
+        for args in [[], ['--jobs', '2', '--batch-size', '2']]:
+            with self.subTest(args=args):
+                result = self.validate('--xpos-tagset', 'penn', *args)
+                self.assertEqual(result.stderr, '')
+                self.assertEqual(result.stdout.splitlines(), stts_errors)
+
+    def test_config(self):
+        config = self.write_file('validator.toml', 'xpos-tagset = "penn"\n')
+        result = self.validate('--config', config)
+        self.assertEqual(result.stderr, '')
+        self.assertEqual(result.stdout.splitlines(), stts_errors)
+
+    def test_rule_pack_tagset(self):
+        # A tagset from a rule pack, which the option takes precedence over in the config.
+        self.write_file('project.toml', '[xpos-tagsets]\nstts = ["PDS", "VAFIN", "ADJA", "ADJD"]\n')
+        config = self.write_file('validator.toml', 'rule-packs = ["project.toml"]\nxpos-tagset = "penn"\n')
+        result = self.validate('--config', config, '--xpos-tagset', 'stts')
+        self.assertEqual(result.stderr, '')
+        errors = result.stdout.splitlines()
+        self.assertNotEqual(errors, [])
+        self.assertTrue(all(error.startswith('ERROR: Sentence doc1-') or error.startswith('ERROR: Sentence doc3-')
+                            for error in errors), errors)
+        self.assertIn("ERROR: Sentence doc1-s1 token 1 -- unknown XPOS value 'PRP'", errors)
+
+    def test_unknown_tagset(self):
+        for args in [['--xpos-tagset', 'stts'],
+                     ['--config', self.write_file('validator.toml', 'xpos-tagset = "stts"\n')]]:
+            with self.subTest(args=args):
+                result = self.validate(*args)
+                self.assertEqual(result.returncode, 2)
+                self.assertEqual(result.stdout, '')
+                self.assertIn("unknown XPOS tagset 'stts'", result.stderr)
+
+    def test_invalid_config_value(self):
+        result = self.validate('--config', self.write_file('validator.toml', 'xpos-tagset = ["penn"]\n'))
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("option 'xpos-tagset' in ", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from helpers import data_file, load_validate, parse_validate_args, validate
+from validator import logger
+from validator.profiler import Profiler
+
+sentence_count = 7  # The number of sentences in corpus.conllu.
+
+
+class TestProfiler(unittest.TestCase):
+    def profile(self, *args):
+        validate_module = load_validate()
+        args = parse_validate_args(validate_module, '--validator', 'all', *args, data_file('corpus.conllu'))
+        profiler = Profiler()
+        validators = validate_module.create_validators(args, profiler)
+        with logger.run_context(logger.CollectorSink()), profiler.instrument_rules():
+            validate_module.validate_conllu(args.input, args.language, validators, args.reader)
+        return profiler
+
+    def test_hooks_and_rules(self):
+        profiler = self.profile('--lemma-cache-size', '0')
+        entries = {(entry['group'], entry['name']): entry for entry in profiler.report()}
+        for name in load_validate().validators:
+            self.assertEqual(entries[(name, 'validate_sentence')]['calls'], sentence_count, name)
+        self.assertIn(('lemma', 'validate_token'), entries)
+        self.assertIn(('lemma', 'validate_word'), entries)
+        self.assertIn(('lemma-rule', 'plural-common-noun'), entries)
+        self.assertIn(('num-format', 'NumType=Card'), entries)
+        # Without the cache, each lemma is a cache miss that calls a lemma rule.
+        rule_calls = sum(entry['calls'] for (group, _), entry in entries.items() if group == 'lemma-rule')
+        self.assertEqual(entries[('lemma', 'cache misses')]['calls'], rule_calls)
+        self.assertNotIn(('lemma', 'cache hits'), entries)
+
+    def test_report_order(self):
+        report = self.profile().report()
+        self.assertEqual(report, sorted(report, key=lambda entry: -entry['seconds']))
+        for entry in report:
+            self.assertEqual(sorted(entry.keys()), ['calls', 'group', 'name', 'seconds'])
+            self.assertGreater(entry['calls'], 0)
+
+    def test_summary(self):
+        profiler = self.profile()
+        report = profiler.report()
+        stream = io.StringIO()
+        profiler.write_summary(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[0].split(), ['group', 'name', 'calls', 'total', '(s)', 'per', 'call', '(us)'])
+        # The group, name, and calls columns.
+        self.assertEqual([[line[:16].strip(), line[17:57].strip(), line[58:68].strip()]
+                          for line in lines[1:len(report) + 1]],
+                         [[entry['group'], entry['name'], str(entry['calls'])] for entry in report])
+        self.assertEqual(lines[-1],
+                         'The lemma-rule calls are the lemma cache misses, as the cached lemmas do not call the rules.')
+
+    def test_json(self):
+        profiler = self.profile()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'profile.json')
+            profiler.write_json(filename)
+            with open(filename, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), profiler.report())
+
+    def test_stats(self):
+        # The stats are the entries since the previous call, and are added to another profiler.
+        profiler = Profiler()
+        timed = profiler.timed(('group', 'name'), len)
+        timed('ab')
+        timed('cd')
+        self.assertEqual(profiler.stats()[('group', 'name')][0], 2)
+        timed('ef')
+        stats = profiler.stats()
+        self.assertEqual(stats[('group', 'name')][0], 1)
+        self.assertEqual(profiler.stats(), {})
+        total = Profiler()
+        total.merge(stats)
+        total.merge(stats)
+        self.assertEqual(total.entries[('group', 'name')][0], 2)
+
+    def test_parallel_jobs(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for args in [[], ['--jobs', '2', '--batch-size', '2']]:
+                with self.subTest(args=args):
+                    filename = os.path.join(temp_dir, 'profile.json')
+                    result = validate('--validator', 'all', *args, data_file('corpus.conllu'), '--profile', filename)
+                    self.assertEqual(result.stderr, '')
+                    with open(filename, encoding='utf-8') as f:
+                        entries = {(entry['group'], entry['name']): entry for entry in json.load(f)}
+                    self.assertEqual(entries[('lemma', 'validate_sentence')]['calls'], sentence_count)
+                    self.assertEqual(entries[('sentence-text', 'validate_sentence')]['calls'], sentence_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
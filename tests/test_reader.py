@@ -0,0 +1,114 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+import unittest
+
+from helpers import data_file, validate
+from validator import conllutil
+from validator import logger
+from validator.reader import FIELDS, is_valid_id, parse_conllu_mmap, parse_ids
+
+
+def sentence_fields(filename, reader):
+    sentences = []
+    for sent in conllutil.parse_conllu(data_file(filename), reader):
+        tokens = []
+        for kind, token, _ in conllutil.token_sequence(sent):
+            tokens.append((kind, [conllutil.get_field(token, field) for field in FIELDS]))
+        sentences.append((dict(sent.metadata), tokens))
+    return sentences
+
+
+# The built-in readers, compared with the conllu library.
+native_readers = ['native', 'mmap']
+
+
+class TestReader(unittest.TestCase):
+    def assertSameOutput(self, *args):
+        expected = validate('--reader', 'conllu', *args)
+        self.assertEqual(expected.stderr, '')
+        for reader in native_readers:
+            with self.subTest(reader=reader):
+                actual = validate('--reader', reader, *args)
+                self.assertEqual(actual.stderr, '')
+                self.assertEqual(actual.stdout, expected.stdout)
+                self.assertEqual(actual.returncode, expected.returncode)
+        return expected
+
+    def test_validator_output(self):
+        expected = self.assertSameOutput('--validator', 'all', data_file('corpus.conllu'))
+        self.assertNotEqual(expected.stdout, '')
+
+    def test_validator_jsonl_output(self):
+        self.assertSameOutput('--validator', 'all', '--format', 'jsonl', data_file('corpus.conllu'))
+
+    def test_line_layout(self):
+        # CRLF line endings, two-space separated fields, extra and empty columns, and `_` IDs.
+        self.assertSameOutput('--validator', 'all', data_file('layout.conllu'))
+
+    def test_field_values(self):
+        for filename in ['corpus.conllu', 'layout.conllu']:
+            expected = sentence_fields(filename, 'conllu')
+            for reader in native_readers:
+                with self.subTest(filename=filename, reader=reader):
+                    self.assertEqual(sentence_fields(filename, reader), expected)
+
+    def test_token_views(self):
+        # The token views are created when first used, and index the sentence's columns.
+        for reader in native_readers:
+            with self.subTest(reader=reader):
+                sent = next(conllutil.parse_conllu(data_file('corpus.conllu'), reader))
+                self.assertIs(sent[0], sent[0])
+                self.assertEqual(sent[-1]['form'], '.')
+                self.assertEqual([token['form'] for token in sent][:3], ['I', "don't", 'do'])
+                self.assertEqual(sent[1]['id'], (2, '-', 3))
+                self.assertEqual(sent[0]['feats']['PronType'], 'Prs')
+
+    def test_mmap_selected_fields(self):
+        # The fields that are not selected are decoded when they are used.
+        expected = list(conllutil.parse_conllu(data_file('corpus.conllu'), 'native'))
+        actual = list(parse_conllu_mmap(data_file('corpus.conllu'), ['form']))
+        self.assertEqual(len(actual), len(expected))
+        for actual_sent, expected_sent in zip(actual, expected):
+            for field in FIELDS:
+                self.assertEqual([token[field] for token in actual_sent], [token[field] for token in expected_sent])
+
+    def test_mmap_empty_file(self):
+        with tempfile.NamedTemporaryFile(suffix='.conllu') as f:
+            self.assertEqual(list(parse_conllu_mmap(f.name)), [])
+
+    def test_misc_without_value(self):
+        for reader in ['conllu'] + native_readers:
+            with self.subTest(reader=reader):
+                sent = next(conllutil.parse_conllu(data_file('layout.conllu'), reader))
+                self.assertEqual(conllutil.get_field(sent[0], 'misc'), {'Foo': ''})
+                self.assertEqual(conllutil.get_misc(sent[0], 'Foo', None), '')
+
+    def test_ids(self):
+        for value in ['1', '10', '1-2', '8.1', '_', '']:
+            self.assertTrue(is_valid_id(value), value)
+            parse_ids([value])
+        for value in ['x', '²', '١', '1-²', '1.²', '+1', '1_0', '1-', '-1']:
+            self.assertFalse(is_valid_id(value), value)
+            self.assertRaises(ValueError, parse_ids, [value])
+
+    def test_invalid_lines(self):
+        # The built-in readers report the lines the conllu library cannot parse, and validate the rest.
+        with logger.run_context(logger.CollectorSink()) as context:
+            for reader in native_readers:
+                list(conllutil.parse_conllu(data_file('invalid.conllu'), reader))
+        self.assertEqual([(d.validator, d.rule, d.sent_id) for d in context.sink.diagnostics],
+                         [('reader', 'invalid-line', 'bad-s1')] * 3 * len(native_readers))
+        for reader in native_readers:
+            with self.subTest(reader=reader):
+                result = validate('--reader', reader, '--validator', 'all', data_file('invalid.conllu'))
+                self.assertEqual(result.stderr, '')
+                self.assertEqual(result.stdout.splitlines(), [
+                    "ERROR: Sentence bad-s1 -- skipped line without tab-separated fields: 'bogus'",
+                    "ERROR: Sentence bad-s1 -- skipped line with an invalid ID 'x'",
+                    "ERROR: Sentence bad-s1 -- skipped line with an invalid ID '²'",
+                ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import helpers  # noqa: F401 -- adds the validator package to the path
+from validator import rulepacks
+from validator.contractions import ContractionValidator
+from validator.lemma import TokenLemmaValidator
+from validator.mwt import MwtWordValidator
+from validator.pos import PosTagValidator
+
+
+class TestRulePackCache(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.cache_dir = os.path.join(self.temp_dir, 'cache', 'conllu-en-validator')
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': os.path.join(self.temp_dir, 'cache')})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # The install is read-only, so the tests do not write to the package's data directory.
+        self.data_files = sorted(os.listdir(rulepacks.data_dir))
+        self.addCleanup(lambda: self.assertEqual(sorted(os.listdir(rulepacks.data_dir)), self.data_files))
+        self.rule_pack = os.path.join(self.temp_dir, 'project.toml')
+        self.write_rule_pack('[lemma-exceptions.NN]\ndata = "datum"\n')
+        self.filenames = rulepacks.builtin_rule_packs + [self.rule_pack]
+
+    def write_rule_pack(self, text):
+        with open(self.rule_pack, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_cache_location(self):
+        tables, _ = rulepacks.load_rules(self.filenames)
+        self.assertEqual(tables['lemma_exceptions']['NN']['data'], 'datum')
+        caches = rulepacks.cache_filenames(self.filenames)
+        self.assertEqual(len(caches), 1)
+        self.assertEqual(os.path.dirname(caches[0]), self.cache_dir)
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(caches[0])])
+
+    def test_builtin_cache_location(self):
+        # The installed cache is read first, but the cache is written to the user's cache directory.
+        with mock.patch.object(rulepacks, 'data_dir', os.path.join(self.temp_dir, 'install')):
+            filenames = list(rulepacks.builtin_rule_packs)
+            self.assertEqual(rulepacks.cache_filenames(filenames), [
+                os.path.join(self.temp_dir, 'install', 'compiled.pickle'),
+                os.path.join(self.cache_dir, 'compiled.pickle'),
+            ])
+            rulepacks.load_rules(filenames)
+            self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'install')))
+        self.assertEqual(os.listdir(self.cache_dir), ['compiled.pickle'])
+
+    def test_cache_is_used(self):
+        expected, _ = rulepacks.load_rules(self.filenames)
+        with mock.patch.object(rulepacks, 'compile_rules', side_effect=AssertionError('the cache was not used')):
+            tables, _ = rulepacks.load_rules(self.filenames)
+        self.assertEqual(tables, expected)
+
+    def test_out_of_date_cache(self):
+        rulepacks.load_rules(self.filenames)
+        self.write_rule_pack('[lemma-exceptions.NN]\ndata = "data"\nmedia = "medium"\n')
+        tables, _ = rulepacks.load_rules(self.filenames)
+        self.assertEqual(tables['lemma_exceptions']['NN']['data'], 'data')
+        self.assertEqual(tables['lemma_exceptions']['NN']['media'], 'medium')
+
+    def test_out_of_date_cache_is_not_unpickled(self):
+        rulepacks.load_rules(self.filenames)
+        self.write_rule_pack('[lemma-exceptions.NN]\nmedia = "medium"\n')
+        with mock.patch('pickle.load', side_effect=AssertionError('the cache was unpickled')):
+            tables, _ = rulepacks.load_rules(self.filenames)
+        self.assertEqual(tables['lemma_exceptions']['NN'], {'media': 'medium'})
+
+    def test_invalid_cache(self):
+        cache = rulepacks.cache_filenames(self.filenames)[0]
+        os.makedirs(self.cache_dir)
+        for data in [b'', b'not json\n', b'{"version": 4}\n', b'\x80\x04\x95']:
+            with self.subTest(data=data):
+                with open(cache, 'wb') as f:
+                    f.write(data)
+                tables, _ = rulepacks.load_rules(self.filenames)
+                self.assertEqual(tables['lemma_exceptions']['NN']['data'], 'datum')
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'requires POSIX file permissions')
+    def test_untrusted_cache(self):
+        rulepacks.load_rules(self.filenames)
+        cache = rulepacks.cache_filenames(self.filenames)[0]
+        os.chmod(cache, 0o666)
+        with mock.patch('pickle.load', side_effect=AssertionError('the cache was unpickled')):
+            rulepacks.load_rules(self.filenames)
+
+    def test_unwritable_cache(self):
+        with mock.patch.object(rulepacks, 'write_cache', side_effect=PermissionError('read-only')):
+            tables, _ = rulepacks.load_rules(self.filenames)
+        self.assertEqual(tables['lemma_exceptions']['NN']['data'], 'datum')
+
+    def test_loaded_once(self):
+        validators = [ContractionValidator, TokenLemmaValidator, MwtWordValidator, PosTagValidator]
+        with mock.patch.object(rulepacks, 'loaded_sources', None), \
+                mock.patch.object(rulepacks, 'load_rules', wraps=rulepacks.load_rules) as load_rules:
+            for validator in validators:
+                validator('en')
+            self.assertEqual(load_rules.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from helpers import readers
+from validator import conllutil
+from validator import logger
+from validator.sentence import SentenceTextValidator, TextMatcher
+
+sentence = """# sent_id = text-1
+# text = I can't go home.
+1\tI\tI\tPRON\tPRP\t_\t3\tnsubj\t_\t_
+2-3\tcannot\t_\t_\t_\t_\t_\t_\t_\t_
+2\tca\tcan\tAUX\tMD\t_\t4\taux\t_\t_
+3\tnot\tnot\tPART\tRB\t_\t4\tadvmod\t_\t_
+4\tgo\tgo\tVERB\tVB\t_\t0\troot\t_\t_
+5\thome\thome\tADV\tRB\t_\t4\tadvmod\t_\tSpaceAfter=No
+6\t.\t.\tPUNCT\t.\t_\t4\tpunct\t_\t_
+"""
+
+
+def match(text, spans):
+    matcher = TextMatcher(text)
+    for span in spans:
+        matcher.append(span)
+    return matcher
+
+
+class TestTextMatcher(unittest.TestCase):
+    def test_match(self):
+        matcher = match('Hello world.', ['Hello', ' ', 'world', '.'])
+        self.assertIsNone(matcher.finish())
+
+    def test_mismatch_at_start(self):
+        matcher = match('Hello world.', ['Jello', ' ', 'world', '.'])
+        self.assertEqual(matcher.finish(), 0)
+        self.assertEqual(matcher.expect_context(), 'Hello world.')
+        self.assertEqual(matcher.actual_context(), 'Jello world.')
+
+    def test_mismatch_within_span(self):
+        matcher = match('Hello world.', ['Hello', ' ', 'word', '.'])
+        self.assertEqual(matcher.finish(), 9)
+        self.assertEqual(matcher.expect_context(), 'Hello world.')
+        self.assertEqual(matcher.actual_context(), 'Hello word.')
+
+    def test_text_longer_than_stream(self):
+        # The mismatch is at the end of the stream.
+        matcher = match('Hello world.', ['Hello', ' ', 'world'])
+        self.assertEqual(matcher.finish(), 11)
+        self.assertEqual(matcher.expect_context(), 'Hello world.')
+        self.assertEqual(matcher.actual_context(), 'Hello world')
+
+    def test_stream_longer_than_text(self):
+        # The mismatch is at the end of the text.
+        matcher = match('Hello world.', ['Hello', ' ', 'world', '.', ' ', 'Bye'])
+        self.assertEqual(matcher.finish(), 12)
+        self.assertEqual(matcher.expect_context(), 'Hello world.')
+        self.assertEqual(matcher.actual_context(), 'Hello world. Bye')
+
+    def test_empty_text(self):
+        matcher = match('', ['Hello'])
+        self.assertEqual(matcher.finish(), 0)
+        self.assertEqual(matcher.expect_context(), '')
+        self.assertEqual(matcher.actual_context(), 'Hello')
+
+    def test_context_window(self):
+        # The context is the context_size characters before the mismatch, and the context_size
+        # characters from the mismatch.
+        text = 'a' * 30 + 'X' + 'b' * 30
+        matcher = match(text, ['a' * 30 + 'Y' + 'b' * 30])
+        self.assertEqual(matcher.finish(), 30)
+        self.assertEqual(matcher.expect_context(), 'a' * 20 + 'X' + 'b' * 19)
+        self.assertEqual(matcher.actual_context(), 'a' * 20 + 'Y' + 'b' * 19)
+
+    def test_context_window_at_start(self):
+        text = 'X' + 'b' * 30
+        matcher = match(text, ['Y' + 'b' * 30])
+        self.assertEqual(matcher.finish(), 0)
+        self.assertEqual(matcher.expect_context(), 'X' + 'b' * 19)
+        self.assertEqual(matcher.actual_context(), 'Y' + 'b' * 19)
+
+    def test_context_window_at_end(self):
+        text = 'a' * 30 + 'X'
+        matcher = match(text, ['a' * 30, 'Y'])
+        self.assertEqual(matcher.finish(), 30)
+        self.assertEqual(matcher.expect_context(), 'a' * 20 + 'X')
+        self.assertEqual(matcher.actual_context(), 'a' * 20 + 'Y')
+
+    def test_stream_is_not_kept_after_the_window(self):
+        # The spans are kept until they fill the context.
+        matcher = match('Hello world.', ['Jello'] + [' ', 'world'] * 100)
+        self.assertEqual(matcher.finish(), 0)
+        self.assertEqual(matcher.actual, ['Jello', ' ', 'world', ' ', 'world', ' ', 'world'])
+        self.assertEqual(matcher.actual_context(), 'Jello world world wo')
+
+    def test_mismatch_is_kept(self):
+        # The text after the first mismatch is not matched against the stream.
+        matcher = match('Hello world.', ['Hello', '_', 'world', '.'])
+        self.assertEqual(matcher.finish(), 5)
+        self.assertEqual(matcher.finish(), 5)
+        self.assertEqual(matcher.actual_context(), 'Hello_world.')
+
+
+class TestSentenceTextValidator(unittest.TestCase):
+    def test_text_mismatch_messages(self):
+        for reader in readers:
+            with self.subTest(reader=reader):
+                sent = conllutil.parse_sentence_block(sentence, reader)
+                with logger.run_context(logger.CollectorSink()) as context:
+                    SentenceTextValidator('en').validate_sentence(sent)
+                self.assertEqual([(d.rule, d.format_message(), d.expect, d.actual)
+                                  for d in context.sink.diagnostics], [
+                    ('token-text-mismatch', 'text does not match the token sequence at offset 5',
+                     "I can't go home.", 'I cannot go home.'),
+                    ('word-text-mismatch', 'text does not match the word sequence at offset 5',
+                     "I can't go home.", 'I canot go home.'),
+                ])
+
+
+if __name__ == '__main__':
+    unittest.main()
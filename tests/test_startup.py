@@ -0,0 +1,47 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+import unittest
+
+from helpers import data_file, root_dir
+
+# Run the validate script, and print the modules that are imported.
+imported_modules = """
+import runpy, sys
+sys.argv = ['validate'] + sys.argv[1:]
+try:
+    runpy.run_path('validate', run_name='__main__')
+except SystemExit:
+    pass
+sys.stdout = sys.__stdout__
+print(' '.join(sorted(sys.modules)))
+"""
+
+
+def modules(*args):
+    command = [sys.executable, '-c', imported_modules] + list(args)
+    result = subprocess.run(command, cwd=root_dir, capture_output=True, text=True)
+    return set(result.stdout.splitlines()[-1].split())
+
+
+class TestStartup(unittest.TestCase):
+    def test_optional_modules(self):
+        # The modules only used by some options are not imported by the other runs.
+        imported = modules('--validator', 'sentence-text', data_file('corpus.conllu'))
+        self.assertIn('validator.sentence', imported)
+        for module in ['tomllib', 'tomli', 'multiprocessing', 'validator.lemma']:
+            self.assertNotIn(module, imported)
+
+    def test_config_modules(self):
+        imported = modules('--config', os.devnull, data_file('corpus.conllu'))
+        self.assertTrue('tomllib' in imported or 'tomli' in imported)
+
+    def test_jobs_modules(self):
+        imported = modules('--jobs', '2', data_file('corpus.lst'))
+        self.assertIn('multiprocessing', imported)
+
+
+if __name__ == '__main__':
+    unittest.main()
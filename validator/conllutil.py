@@ -1,6 +1,10 @@
 # Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
 
 import conllu
+from conllu.parser import parse_comment_line
+
+from validator import reader as native_reader
+from validator.reader import TOKEN, WORD, MWT, EMPTY_NODE
 
 
 def parse_filelist(filename):
@@ -12,25 +16,106 @@ def parse_filelist(filename):
             yield line
 
 
-def parse_conllu(filename):
+def parse_conllu(filename, reader='conllu', fields=native_reader.FIELDS):
+    if reader == 'native':
+        for sent in native_reader.parse_conllu(filename):
+            yield sent
+        return
+    if reader == 'mmap':
+        for sent in native_reader.parse_conllu_mmap(filename, fields):
+            yield sent
+        return
+
     with open(filename, 'r', encoding='utf-8') as f:
         for sent in conllu.parse_incr(f):
             yield sent
 
 
+def parse_sentence_blocks(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        for block in conllu.parse_sentences(f):
+            yield block
+
+
+def parse_sentence_block(block, reader='conllu'):
+    if reader in ['native', 'mmap']:
+        return native_reader.parse_sentence_block(block)
+    return conllu.parse_token_and_metadata(block)
+
+
+def parse_metadata(block, reader='conllu'):
+    if reader in ['native', 'mmap']:
+        return native_reader.parse_metadata(block)
+
+    metadata = {}
+    for line in block.split('\n'):
+        line = line.strip()
+        if line.startswith('#'):
+            for key, value in parse_comment_line(line):
+                metadata[key] = value
+    return metadata
+
+
+def token_sequence(sent):
+    if isinstance(sent, native_reader.Sentence):
+        return sent.token_sequence()
+
+    # The sequence is computed once for each sentence, and shared by the validators.
+    sequence = getattr(sent, 'sequence', None)
+    if sequence is not None:
+        return sequence
+    sequence = []
+    mwt = None
+    for token in sent:
+        if token['id'] is None or type(token['id']) is int:  # token, word
+            if mwt is not None and token['id'] is not None and mwt['id'][2] >= token['id']:
+                sequence.append((WORD, token, mwt))
+            else:
+                sequence.append((TOKEN, token, None))
+        elif '.' in token['id']:  # empty node
+            sequence.append((EMPTY_NODE, token, None))
+        else:  # multi-word token
+            mwt = token
+            sequence.append((MWT, token, None))
+    sent.sequence = sequence
+    return sequence
+
+
+def word_values(sent, field):
+    # The field values of the tokens and words, i.e. not the multi-word tokens or empty nodes.
+    if isinstance(sent, native_reader.Sentence) and field in sent.decoded_fields:
+        return [value for kind, value in zip(sent.kinds, getattr(sent, field)) if kind == TOKEN or kind == WORD]
+    return [token[field] for kind, token, _ in token_sequence(sent) if kind == TOKEN or kind == WORD]
+
+
+no_fields = {}  # The default for the FEATS and MISC fields, which must not be modified.
+
+
+def get_field(token, field, default=None):
+    try:
+        value = token[field]  # The native reader parses FEATS and MISC here.
+    except KeyError:
+        return default
+    if value is None:
+        return default
+    return value
+
+
 def get_feat(token, attr, default):
-    if 'feats' not in token:
+    try:
+        feat = token['feats']  # The native reader parses FEATS here.
+    except KeyError:
         return default
-    feat = token['feats']
     if feat is None or attr not in feat:
         return default
     return feat[attr]
 
 
 def get_misc(token, attr, default):
-    if 'misc' not in token:
+    try:
+        misc = token['misc']  # The native reader parses MISC here.
+    except KeyError:
         return default
-    misc = token['misc']
     if misc is None or attr not in misc:
         return default
     return misc[attr]
@@ -2,27 +2,32 @@
 
 from validator.validator import MwtValidator
 from validator.logger import log, LogLevel
+from validator import rulepacks
+from validator.rulepacks import contraction_splits
 
-
-dialectal_continuations = [
-    'an\'',  # and
-    '\'bout',  # about
-    '\'em',  # them
-    '\'fore',  # before
-    '\'twas',  # 't was
-    '\'twill',  # 't will
-]
+apostrophes = ['\'', '’']
 
 
 class ContractionValidator(MwtValidator):
+    name = 'contractions'
+    fields = ['form', 'upos', 'deprel', 'misc']
+    rules = {
+        'split-contraction': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
+        rulepacks.load_rule_packs()
 
     @staticmethod
-    def is_contraction(form):
-        if form.endswith('in\'') and form[0].isalpha():  # -in' -> ing
-            return True
-        return form.lower() in dialectal_continuations
+    def is_contraction(prev_form, form):
+        # Check the pair of forms as if they were joined, without joining them.
+        if (form or prev_form)[-1:] in apostrophes:
+            tail = form if len(form) >= 3 else prev_form[-3:] + form
+            if tail[-3:-1] == 'in' and (prev_form or form)[0].isalpha():  # -in' -> ing
+                return True
+        second_forms = contraction_splits.get(prev_form.lower())
+        return second_forms is not None and form.lower() in second_forms
 
     @staticmethod
     def is_punctuation(token):
@@ -35,8 +40,6 @@ class ContractionValidator(MwtValidator):
     def validate_mwt_pair(self, sent, prev_token, token, mwt):
         if self.is_punctuation(prev_token) or self.is_punctuation(token):
             return
-        form = prev_token['form'] + token['form']
-        form = form.replace('’', '\'')
-        if '\'' in form and self.is_contraction(form):
-            log(LogLevel.ERROR, sent, token,
-                f"incorrectly split dialectal contraction for '{prev_token['form']}][{token['form']}'")
+        if self.is_contraction(prev_token['form'], token['form']):
+            log(LogLevel.ERROR, sent, token, "incorrectly split dialectal contraction for '{prev_form}][{form}'",
+                rule='split-contraction', prev_form=prev_token['form'], form=token['form'])
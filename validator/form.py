@@ -7,7 +7,7 @@ from validator.validator import Validator
 from validator.logger import log, LogLevel
 
 
-punct_forms = [
+punct_forms = frozenset([
     # ASCII
     '\u0021',  # EXCLAMATION MARK
     '\u0022',  # QUOTATION MARK
@@ -30,9 +30,9 @@ punct_forms = [
     '\u201C',  # LEFT DOUBLE QUOTATION MARK
     '\u201D',  # RIGHT DOUBLE QUOTATION MARK
     '\u2026',  # HORIZONTAL ELLIPSIS
-]
+])
 
-cardinal_word_forms = [
+cardinal_word_forms = frozenset([
     "zero", "nil",  # 0
     "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",  # 1 - 10
     "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen",  # 11 - 19
@@ -44,9 +44,9 @@ cardinal_word_forms = [
     "b", "billion", "bn",  # 1,000,000,000
     "t", "trillion",  # 1,000,000,000,000
     "zillion",  # very large
-]
+])
 
-ordinal_word_forms = [
+ordinal_word_forms = frozenset([
     "zeroth",  # 0
     "first", "second", "third", "fourth", "fifth", "sixth", "seventh", "eighth", "ninth", "tenth",  # 1 - 10
     "eleventh", "twelfth", "thirteenth", "fourteenth", "fifteenth", "sixteenth", "seventeenth", "eighteenth", "nineteenth",  # 11 - 19
@@ -57,18 +57,17 @@ ordinal_word_forms = [
     "billionth",  # 1,000,000,000
     "trillionth",  # 1,000,000,000,000
     "zillionth",  # very large
-]
+])
 
-fractional_word_forms = [
+fractional_word_forms = frozenset([
     "half",  # 1/2
     "quarter",  # 1/4
-]
-fractional_word_forms.extend(ordinal_word_forms)  # 1/N
+]) | ordinal_word_forms  # 1/N
 
-multiplicative_word_forms = [
+multiplicative_word_forms = frozenset([
     "once",
     "twice",
-]
+])
 
 symbol_general_categories = [
     'Po',  # punctuation (other)
@@ -92,11 +91,11 @@ word_form_additional_characters = [
     '\u2019',  # RIGHT SINGLE QUOTATION MARK
 ]
 
-word_additional_cconj_forms = [
+word_additional_cconj_forms = frozenset([
     '&',  # and
-]
+])
 
-symbol_additional_forms = [
+symbol_additional_forms = frozenset([
     # Sideways Emoticons: https://en.wikipedia.org/wiki/List_of_emoticons
     ':)', ':-)', '=)', '(:',  # smiling
     ':D', ':-D', '=D', 'D:',  # laughing; grinning
@@ -122,7 +121,51 @@ symbol_additional_forms = [
     '==',  # equals
     '!=',  # not equals
     '>=',  # greater-than or equals
-]
+])
+
+# The character classification flags, used to match the characters of symbol and word forms.
+SYMBOL_CHARACTER = 1
+WORD_CHARACTER = 2
+
+
+def classify_character(c):
+    flags = 0
+    cat = unicodedata.category(c)
+    if cat in symbol_general_categories:
+        flags = flags | SYMBOL_CHARACTER
+    if cat in word_general_categories or c in word_form_additional_characters:
+        flags = flags | WORD_CHARACTER
+    return flags
+
+
+class CharacterClass:
+    # The characters that are known to have, or not have, the flag. These are precomputed for
+    # the ASCII characters, so ASCII forms are matched in one step, and the other characters are
+    # added the first time they are classified.
+    def __init__(self, flag):
+        self.flag = flag
+        self.members = {chr(code) for code in range(0x80) if classify_character(chr(code)) & flag}
+        self.non_members = {chr(code) for code in range(0x80)} - self.members
+
+    def all_members(self, form):
+        if self.members.issuperset(form):
+            return True
+        if not self.non_members.isdisjoint(form):
+            return False
+        for c in form:
+            if c in self.members:
+                continue
+            if not classify_character(c) & self.flag:
+                self.non_members.add(c)
+                return False
+            self.members.add(c)
+        return True
+
+
+symbol_characters = CharacterClass(SYMBOL_CHARACTER)
+
+word_characters = CharacterClass(WORD_CHARACTER)
+
 
 RE_CARDINAL = re.compile("^[0-9][0-9A-Za-z]+$")
 
@@ -149,31 +192,64 @@ RE_ROMAN_DIGITS = re.compile(r"""^
 $""", re.VERBOSE)
 
 
+def number_form_pattern(name, regex):
+    # The pattern without the ^ and $ anchors, as a named group.
+    pattern = regex.pattern.strip()
+    return f"(?P<{name}>{pattern[1:-1]})"
+
+
+# Classifies a number form as Digit, Combi, Frac, Roman, or Other (RE_CARDINAL) in one match.
+# The first four are disjoint, and are matched before Other. Other also matches some Digit
+# and Combi forms.
+RE_NUMBER_FORM = re.compile('|'.join([
+    number_form_pattern('Digit', RE_CARDINAL_DIGITS),
+    number_form_pattern('Combi', RE_ORDINAL_COMBINED),
+    number_form_pattern('Frac', RE_FRACTIONAL_DIGITS),
+    number_form_pattern('Roman', RE_ROMAN_DIGITS),
+    number_form_pattern('Other', RE_CARDINAL),
+]), re.VERBOSE)
+
+
+def number_form(form):
+    match = RE_NUMBER_FORM.fullmatch(form)
+    if match is None:
+        return None
+    return match.lastgroup
+
+
 def cardinal_number(sent, token, form):
+    num_form = number_form(form)
     # NumForm=Digit
-    if RE_CARDINAL_DIGITS.fullmatch(form):
-        log(LogLevel.ERROR, sent, token, f"NumType=Card should be paired with NumForm=Digit for form '{form}'")
+    if num_form == 'Digit':
+        log(LogLevel.ERROR, sent, token, "NumType=Card should be paired with NumForm={expect} for form '{form}'",
+            expect='Digit', rule='missing-num-form', form=form)
         return True
     # NumForm=Roman
-    if RE_ROMAN_DIGITS.fullmatch(form):
-        log(LogLevel.ERROR, sent, token, f"NumType=Card should be paired with NumForm=Roman for form '{form}'")
+    if num_form == 'Roman':
+        log(LogLevel.ERROR, sent, token, "NumType=Card should be paired with NumForm={expect} for form '{form}'",
+            expect='Roman', rule='missing-num-form', form=form)
         return True
     # NumForm=Word
     if form.lower() in cardinal_word_forms:
-        log(LogLevel.ERROR, sent, token, f"NumType=Card should be paired with NumForm=Word for form '{form}'")
+        log(LogLevel.ERROR, sent, token, "NumType=Card should be paired with NumForm={expect} for form '{form}'",
+            expect='Word', rule='missing-num-form', form=form)
         return True
     # other
-    return RE_CARDINAL.fullmatch(form)
+    if num_form == 'Combi':
+        return RE_CARDINAL.fullmatch(form)  # e.g. 12th, but not 1,000th
+    return num_form == 'Other'
 
 
 def ordinal_number(sent, token, form):
     # NumForm=Combi
-    if RE_ORDINAL_COMBINED.fullmatch(form):
-        log(LogLevel.ERROR, sent, token, f"NumType=Ord should be paired with NumForm=Combi for form '{form}'")
+    if number_form(form) == 'Combi':
+        log(LogLevel.ERROR, sent, token, "NumType=Ord should be paired with NumForm={expect} for form '{form}'",
+            expect='Combi', rule='missing-num-form', form=form)
         return True
     # NumForm=Word
     if form.lower() in ordinal_word_forms:
-        log(LogLevel.ERROR, sent, token, f"NumType=Ord should be paired with NumForm=Word for form '{form}'")
+        log(LogLevel.ERROR, sent, token, "NumType=Ord should be paired with NumForm={expect} for form '{form}'",
+            expect='Word', rule='missing-num-form', form=form)
         return True
     # other
     return False
@@ -182,28 +258,25 @@ def ordinal_number(sent, token, form):
 def multiplicative_number(sent, token, form):
     # NumForm=Word
     if form.lower() in multiplicative_word_forms:
-        log(LogLevel.ERROR, sent, token, f"NumType=Mult should be paired with NumForm=Word for form '{form}'")
+        log(LogLevel.ERROR, sent, token, "NumType=Mult should be paired with NumForm={expect} for form '{form}'",
+            expect='Word', rule='missing-num-form', form=form)
         return True
     # other
     return False
 
 
 def symbol_form(sent, token, form):
-    for c in form:
-        cat = unicodedata.category(c)
-        if cat not in symbol_general_categories:
-            return form in symbol_additional_forms
+    if not symbol_characters.all_members(form):
+        return form in symbol_additional_forms
     return len(form) == 1 or form in symbol_additional_forms
 
 
 def word_form(sent, token, form):
-    for c in form:
-        cat = unicodedata.category(c)
-        if cat not in word_general_categories and c not in word_form_additional_characters:
-            upos = token['upos']
-            if upos == 'CCONJ' and form in word_additional_cconj_forms:
-                return True
-            return False
+    if not word_characters.all_members(form):
+        upos = token['upos']
+        if upos == 'CCONJ' and form in word_additional_cconj_forms:
+            return True
+        return False
     return True
 
 
@@ -226,57 +299,83 @@ num_formats = {
 }
 
 
+# The UPOS values that are checked for the NumType, NumForm and Number features.
+# NOTE: Several English treebanks tag date ordinals as NOUN
+num_format_upos = frozenset(['ADJ', 'ADV', 'DET', 'NUM', 'NOUN'])
+
+
+def validate_punct(sent, token, form):
+    return form in punct_forms
+
+
+def build_validator(upos, num_type=None, num_form=None, number=None):
+    if upos == 'PUNCT':
+        return upos, validate_punct
+    elif upos in num_format_upos:
+        num_format = []
+
+        # https://universaldependencies.org/u/feat/NumType.html
+        if num_type is not None:
+            num_format.append(f"NumType={num_type}")
+
+        # https://universaldependencies.org/u/feat/NumForm.html
+        if num_form is not None:
+            num_format.append(f"NumForm={num_form}")
+
+        # https://universaldependencies.org/u/feat/Number.html
+        if number is not None:
+            num_format.append(f"Number={number}")
+
+        num_format = '|'.join(num_format)
+        if len(num_format) == 0:
+            context = upos
+        else:
+            context = f"{upos} with {num_format}"
+
+        if num_format in num_formats:
+            return context, num_formats[num_format]
+        if upos != 'NUM':
+            return context, word_form
+        return context, None
+    elif upos == 'SYM':
+        return upos, symbol_form
+    else:
+        return upos, word_form
+
+
 class TokenFormValidator(Validator):
+    name = 'form'
+    fields = ['form', 'upos', 'feats', 'misc']
+    rules = {
+        'missing-form': LogLevel.ERROR,
+        'invalid-form': LogLevel.ERROR,
+        'missing-num-form': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
+        # The (context, matcher) for the (upos, NumType, NumForm, Number) values.
+        self.validators = {}
 
-    @staticmethod
-    def validate_punct(sent, token, form):
-        return form in punct_forms
-
-    @staticmethod
-    def get_validator(sent, token):
+    def get_validator(self, sent, token):
         upos = token['upos']
-        if upos == 'PUNCT':
-            return upos, TokenFormValidator.validate_punct
-        elif upos in ['ADJ', 'ADV', 'DET', 'NUM', 'NOUN']:  # NOTE: Several English treebanks tag date ordinals as NOUN
-            num_format = []
-
-            # https://universaldependencies.org/u/feat/NumType.html
-            num_type = conllutil.get_feat(token, 'NumType', None)
-            if num_type is not None:
-                num_format.append(f"NumType={num_type}")
-
-            # https://universaldependencies.org/u/feat/NumForm.html
-            num_form = conllutil.get_feat(token, 'NumForm', None)
-            if num_form is not None:
-                num_format.append(f"NumForm={num_form}")
-
-            # https://universaldependencies.org/u/feat/Number.html
-            number = conllutil.get_feat(token, 'Number', None)
-            if number is not None:
-                num_format.append(f"Number={number}")
-
-            num_format = '|'.join(num_format)
-            if len(num_format) == 0:
-                context = upos
-            else:
-                context = f"{upos} with {num_format}"
-
-            if num_format in num_formats:
-                return context, num_formats[num_format]
-            if upos != 'NUM':
-                return context, word_form
-            return context, None
-        elif upos == 'SYM':
-            return upos, symbol_form
+        if upos in num_format_upos:
+            feats = conllutil.get_field(token, 'feats', conllutil.no_fields)
+            signature = (upos, feats.get('NumType'), feats.get('NumForm'), feats.get('Number'))
         else:
-            return upos, word_form
+            signature = (upos,)
+        try:
+            return self.validators[signature]
+        except KeyError:
+            validator = build_validator(*signature)
+            self.validators[signature] = validator
+            return validator
 
     def validate_token(self, sent, token):
         context, matcher = self.get_validator(sent, token)
         form = conllutil.normalized_form(token)
         if form is None:
-            log(LogLevel.ERROR, sent, token, f"missing form text")
+            log(LogLevel.ERROR, sent, token, "missing form text", rule='missing-form')
         elif matcher is not None and not matcher(sent, token, form):
-            log(LogLevel.ERROR, sent, token, f"invalid {context} form '{form}'")
+            log(LogLevel.ERROR, sent, token, "invalid {context} form '{form}'",
+                rule='invalid-form', context=context, form=form)
@@ -1,8 +1,12 @@
 # Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
 
+import functools
 import re
 
 from validator import conllutil
+from validator import logger
+from validator import rulepacks
+from validator.rulepacks import lemmatization_rule_names, lemma_exception_index
 from validator.validator import Validator
 from validator.logger import log, LogLevel
 
@@ -41,16 +45,162 @@ def fractional_number_lemma(form):
     return normalized, normalized
 
 
+def pattern_tails(source):
+    # The literal endings that a `...$` pattern matches, e.g. `([aiou][^aeiouwy])e[dn]$` => ['ed', 'en'].
+    # An empty ending is returned if the pattern can match any ending.
+    depth = 0
+    for c in re.sub(r'\\.|\[(?:\\.|[^]\\])*\]', '', source):
+        if c == '(':
+            depth = depth + 1
+        elif c == ')':
+            depth = depth - 1
+        elif c == '|' and depth == 0:
+            return ['']
+    if not source.endswith('$') or source.endswith('\\$'):
+        return ['']
+
+    tails = ['']
+    end = len(source) - 1
+    while end > 0:
+        c = source[end - 1]
+        if c == ']':
+            start = source.rfind('[', 0, end - 1)
+            if start < 0 or not source[start + 1:end - 1].isalpha() or source[start - 1:start] == '\\':
+                break
+            tails = [head + tail for head in source[start + 1:end - 1] for tail in tails]
+            end = start
+        elif c.isalpha() and source[end - 2:end - 1] != '\\':
+            tails = [c + tail for tail in tails]
+            end = end - 1
+        else:
+            break
+    return tails
+
+
+def rename_groups(source, prefix):
+    # Give the numbered groups and backreferences of the pattern unique names, so it can
+    # be combined with other patterns, e.g. `([dgnt])\1er$` => `(?P<r2_1>[dgnt])(?P=r2_1)er$`.
+    renamed = []
+    group = 0
+    i = 0
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            if source[i + 1].isdigit():
+                renamed.append(f"(?P={prefix}_{source[i + 1]})")
+            else:
+                renamed.append(source[i:i + 2])
+            i = i + 2
+        elif c == '[':
+            end = i + 2 if source.startswith('[^', i) else i + 1
+            end = end + 1 if source[end] == ']' else end
+            while source[end] != ']':
+                end = end + 2 if source[end] == '\\' else end + 1
+            renamed.append(source[i:end + 1])
+            i = end + 1
+        elif c == '(' and not source.startswith('(?', i):
+            group = group + 1
+            renamed.append(f"(?P<{prefix}_{group}>")
+            i = i + 1
+        elif source.startswith('(?P<', i):
+            raise ValueError(f"named groups are not supported in stemming rule patterns: {source}")
+        else:
+            renamed.append(c)
+            i = i + 1
+    return ''.join(renamed)
+
+
+class StemmingNode:
+    __slots__ = ('children', 'rules', 'candidates', 'compiled', 'pattern', 'templates', 'ending', 'replacement')
+
+    def __init__(self):
+        self.children = {}
+        self.rules = []  # the index of the rules ending with the suffix of this node
+        self.candidates = None  # the index of the rules that can match at this node
+        self.compiled = False
+        self.pattern = None
+        self.templates = None  # group index => (rule group name, replacement template)
+        self.ending = None
+        self.replacement = None
+
+
+class StemmingRules:
+    # The (ending, replacement) stemming rules, where the ending is a string or a `...$`
+    # regex, compiled into a reversed-suffix trie of the rule endings. Each trie node has
+    # a combined regex of the patterns that can match at that suffix, where the first
+    # matching alternative is the first matching rule in the declaration order. The regex
+    # is compiled when the node is first used, so importing the rules is cheap.
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.root = StemmingNode()
+        for index, (ending, replacement) in enumerate(rules):
+            if isinstance(ending, re.Pattern):
+                if ending.flags != re.UNICODE:
+                    raise ValueError(f"flags are not supported in stemming rule patterns: {ending.pattern}")
+                if '(?P<' in ending.pattern:
+                    raise ValueError(f"named groups are not supported in stemming rule patterns: {ending.pattern}")
+                tails = pattern_tails(ending.pattern)
+            else:
+                tails = [ending]
+            for tail in tails:
+                self.add_rule(index, tail)
+        self.add_candidates(self.root, [])
+
+    def add_rule(self, index, tail):
+        node = self.root
+        for c in reversed(tail):
+            node = node.children.setdefault(c, StemmingNode())
+        node.rules.append(index)
+
+    def add_candidates(self, node, candidates):
+        node.candidates = sorted(set(candidates + node.rules))
+        for child in node.children.values():
+            self.add_candidates(child, node.candidates)
+
+    def compile(self, node):
+        alternatives = []
+        templates = {}
+        groups = 0
+        for index in node.candidates:
+            ending, replacement = self.rules[index]
+            if not isinstance(ending, re.Pattern):
+                # A string ending always matches, so the rules after it are not used.
+                node.ending = ending
+                node.replacement = replacement
+                break
+            name = f"r{index}"
+            alternative = rename_groups(ending.pattern, name)
+            alternatives.append(f".*?(?P<{name}>{alternative})")
+            templates[groups + 1] = (name, re.sub(r'\\(\d)', f"\\\\g<{name}_\\1>", replacement))
+            groups = groups + 1 + ending.groups
+        if len(alternatives) != 0:
+            node.pattern = re.compile('|'.join(alternatives), re.DOTALL)
+            node.templates = templates
+        node.compiled = True
+
+    def stem(self, form):
+        node = self.root
+        for c in reversed(form):
+            child = node.children.get(c)
+            if child is None:
+                break
+            node = child
+        if not node.compiled:
+            self.compile(node)
+        if node.pattern is not None:
+            match = node.pattern.match(form)
+            if match is not None:
+                name, template = node.templates[match.lastindex]
+                return form[:match.start(name)] + match.expand(template) + form[match.end(name):]
+        if node.ending is not None:
+            return form[:len(form) - len(node.ending)] + node.replacement
+        return form
+
+
 def stemmed(form, normalize_lemma, stemming_rules):
     normalized, _ = normalize_lemma(form)
-    for ending, replacement in stemming_rules:
-        if isinstance(ending, re.Pattern):
-            replaced, count = ending.subn(replacement, normalized)
-            if count != 0:
-                return normalized, replaced
-        elif normalized.endswith(ending):
-            return normalized, normalized[:-len(ending)] + replacement
-    return normalized, normalized
+    return normalized, stemming_rules.stem(normalized)
 
 
 lemmatization_rules = {
@@ -77,23 +227,23 @@ lemmatization_rules = {
     'present-3p-verb': lambda form: stemmed(form, lowercase_form_lemma, present_3p_verb_stemming_rules),  # -s/-es
 }
 
-comparative_stemming_rules = [
+comparative_stemming_rules = StemmingRules([
     (re.compile(r'([eo]a[^aeiou])er$'), r'\1'),  # oaCer -> oaC ; eaCer -> eaC
     (re.compile(r'([ai][^aeiou]e)r$'), r'\1'),  # aCer -> aCe ; iCer -> iCe
     (re.compile(r'([dgnt])\1er$'), r'\1'),  # CCer -> C
     ('ier', 'y'),
     ('er', ''),
-]
+])
 
-superlative_stemming_rules = [
+superlative_stemming_rules = StemmingRules([
     (re.compile(r'([eo]a[^aeiou])est$'), r'\1'),  # oaCest -> oaC ; eaCest -> eaC
     (re.compile(r'([ai][^aeiou]e)st$'), r'\1'),  # aCest -> aCe ; iCest -> iCe
     (re.compile(r'([dgnt])\1est$'), r'\1'),  # CCest -> C
     ('iest', 'y'),
     ('est', ''),
-]
+])
 
-plural_noun_stemming_rules = [
+plural_noun_stemming_rules = StemmingRules([
     # suffices and compound words
     ('children', 'child'),
     ('heroes', 'hero'),
@@ -108,9 +258,9 @@ plural_noun_stemming_rules = [
     ('(s)', ''),
     # foreign
     ('ae', 'a'),
-]
+])
 
-past_participle_verb_stemming_rules = [
+past_participle_verb_stemming_rules = StemmingRules([
     # -VVCe[dn]
     (re.compile(r'((ee|oo)z)ed$'), r'\1e'),  # VVzed -> VVze
     (re.compile(r'(([aeiou])\2[^aeiou]?)ed$'), r'\1'),  # VVC?ed -> VVC? ~ doubled vowel
@@ -136,9 +286,9 @@ past_participle_verb_stemming_rules = [
     ('en', ''),
     # -n
     (re.compile(r'([ao]w)n$'), r'\1'),  # Vwn -> Vw
-]
+])
 
-past_tense_verb_stemming_rules = [
+past_tense_verb_stemming_rules = StemmingRules([
     # -VVCed
     (re.compile(r'((ee|oo)z)ed$'), r'\1e'),  # VVzed -> VVze
     (re.compile(r'(([aeiou])\2[^aeiou]?)ed$'), r'\1'),  # VVC?ed -> VVC? ~ doubled vowel
@@ -161,9 +311,9 @@ past_tense_verb_stemming_rules = [
     (re.compile(r'^([^aeiou])ied$'), r'\1ie'),  # Cied -> Cie
     ('ied', 'y'),
     ('ed', ''),
-]
+])
 
-present_verb_stemming_rules = [
+present_verb_stemming_rules = StemmingRules([
     # -VVCing
     (re.compile(r'((ee|oo)z)ing$'), r'\1e'),  # VVzing -> VVze
     (re.compile(r'(([aeiou])\2[^aeiou]?)ing$'), r'\1'),  # VVC?ing -> VVC? ~ doubled vowel
@@ -185,9 +335,9 @@ present_verb_stemming_rules = [
     (re.compile(r'([ue])ing$'), r'\1e'),  # Ving -> Ve
     (re.compile(r'^([^aeiou])ying$'), r'\1ie'),  # Cying -> Cie
     ('ing', ''),
-]
+])
 
-present_3p_verb_stemming_rules = [
+present_3p_verb_stemming_rules = StemmingRules([
     # -VVCes
     (re.compile(r'((ee|oo)z)es$'), r'\1e'),  # VVzes -> VVze
     (re.compile(r'((crea|[^v]ie)[^aeioufk])es$'), r'\1e'),  # VVCes -> VVCe
@@ -209,681 +359,7 @@ present_3p_verb_stemming_rules = [
     # -es
     ('es', ''),
     ('s', ''),
-]
-
-lemmatization_rule_names = {
-# https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html
-    'CC': 'lowercase-form',  # coordinating conjunction
-    'CD/NumForm=Combi': 'normalized-form',  # cardinal number, digits with a suffix
-    'CD/NumForm=Digit/NumType=Card': 'cardinal-number',  # cardinal number, integer
-    'CD/NumForm=Digit/NumType=Frac': 'fractional-number',  # cardinal number, fraction
-    'CD/NumForm=Roman': 'normalized-form',  # cardinal number, roman numerals
-    'CD/NumForm=Word': 'lowercase-form',  # cardinal number, words
-    'CD/NumForm=Word/Abbr=Yes': 'lowercase-form',  # cardinal number, word abbreviations
-    'CD+PRON': 'lowercase-form',  # cardinal number, reciprocal pronoun -- "one/PRON+CD another"
-    'DT': 'lowercase-form',  # determiner
-    'EX': 'lowercase-form',  # existential "there"
-    'FW/Abbr=Yes': 'lowercase-form',  # foreign word abbreviation
-    'IN': 'lowercase-form',  # preposition, subordinating conjunction
-    'IN/Abbr=Yes': 'lowercase-form',  # abbreviation of a preposition or subordinating conjunction
-    'JJ': 'lowercase-form',  # adjective, positive (first degree)
-    'JJR': 'comparative',  # adjective, comparative (second degree) [-er]
-    'JJS': 'superlative',  # adjective, superlative (third degree) [-est]
-    'LS': 'normalized-form',  # list item marker
-    'MD': 'lowercase-form',  # verb, modal
-    'NN': 'lowercase-form',  # noun
-    'NN/Abbr=Yes': 'uppercase-form',  # noun abbreviations
-    'NNP': 'capitalized-form',  # proper noun
-    'NNP/Abbr=Yes': 'uppercase-form',  # proper noun abbreviations
-    'NNPS/Number=Coll': 'capitalized-form',  # proper noun, collective / singulare tantum (singular form as plural)
-    'NNPS/Number=Plur': 'plural-proper-noun',  # proper noun, plural
-    'NNPS/Number=Plur/Abbr=Yes': 'plural-proper-abbr',  # proper noun abbreviations, plural
-    'NNPS/Number=Ptan': 'capitalized-form',  # proper noun, plurale tantum (plural form lemma)
-    'NNS/Number=Coll': 'lowercase-form',  # noun, collective / singulare tantum (singular form as plural)
-    'NNS/Number=Plur': 'plural-common-noun',  # noun, plural
-    'NNS/Number=Plur/Abbr=Yes': 'plural-common-noun',  # noun, plural abbreviation
-    'NNS/Number=Ptan': 'lowercase-form',  # noun, plurale tantum (plural form lemma)
-    'PDT': 'lowercase-form',  # predeterminer
-    'POS': 'lowercase-form',  # possessive
-    'PRP': 'lowercase-form',  # pronoun, personal
-    'PRP$': 'lowercase-form',  # pronoun, possessive
-    'RB': 'lowercase-form',  # adverb
-    'RB/Abbr=Yes': 'uppercase-form',  # adverb abbreviations
-    'RBR': 'comparative',  # adverb, comparative (second degree) [-er]
-    'RBS': 'superlative',  # adverb, superlative (third degree) [-est]
-    'RP': 'lowercase-form',  # particle
-    'SYM': 'normalized-form',  # symbol
-    'TO': 'lowercase-form',  # "to"
-    'TO/Abbr=Yes': 'lowercase-form',  # "to" abbreviations
-    'UH': 'lowercase-form',  # interjection
-    'VB': 'lowercase-form',  # verb, base form
-    'VBD': 'past-tense-verb',  # verb, past tense [-ed]
-    'VBG': 'present-verb',  # verb, gerund or present tense [-ing]
-    'VBN': 'past-participle-verb',  # verb, past participle [-en/-ed]
-    'VBP': 'lowercase-form',  # verb, singular present
-    'VBZ': 'present-3p-verb',  # verb, singular present, third person [-s/-es]
-    'WDT': 'lowercase-form',  # determiner, wh-
-    'WP': 'lowercase-form',  # pronoun, wh-
-    'WP$': 'lowercase-form',  # pronoun, possessive wh-
-    'WRB': 'lowercase-form',  # adverb, wh-
-# https://universaldependencies.org/tagset-conversion/en-penn-uposf.html
-# https://www.ldc.upenn.edu/sites/www.ldc.upenn.edu/files/etb-supplementary-guidelines-2009-addendum.pdf
-    '\'\'': 'unmodified-form',  # right (end) quote
-    '$': 'unmodified-form',  # currency symbol
-    ',': 'unmodified-form',  # mid-sentence punctuation -- comma, semicolon, or ellipsis
-    '.': 'unmodified-form',  # sentence-final punctuation -- full stop, exclamation mark, or question mark
-    ':': 'unmodified-form',  # colon or dash
-    '``': 'unmodified-form',  # left (start) quote
-    '-LRB-': 'unmodified-form',  # left parenthesis or bracket
-    '-RRB-': 'unmodified-form',  # right parenthesis or bracket
-    'ADD': 'unmodified-form',  # web address
-    'AFX': 'lowercase-form',  # non-hyphenated affix
-    'HYPH': 'unmodified-form',  # hyphen
-    'NFP': 'lowercase-form',  # non-functional punctuation
-}
-
-lemma_exceptions = {
-    ':': {  # colon or dash
-        '\u2013': '-',  # EN DASH
-        '\u2014': '-',  # EM DASH
-        '...': '\u2026',  # HORIZONTAL ELLIPSIS
-    },
-    'CD/NumForm=Word/Abbr=Yes': {  # cardinal numbers, word
-        'b': 'billion',
-        'bn': 'billion',
-        'k': 'thousand',
-        'm': 'million',
-        't': 'trillion',
-    },
-    'DT': {  # determiners
-        'an': 'a',
-        'these': 'this',
-        'those': 'that',
-    },
-    'FW/Abbr=Yes': {  # foreign word abbreviations
-        'etc': 'etc.',
-        'mlle.': 'Mlle.',
-    },
-    'IN/Abbr=Yes': {  # preposition, subordinating conjunction
-        'vs': 'versus',
-    },
-    'JJ': {  # adjectives
-        # proper noun adjectives
-        'afghan': 'Afghan',
-        'african': 'African',
-        'albanian': 'Albanian',
-        'alexandrine': 'Alexandrine',
-        'american': 'American',
-        'arab': 'Arab',
-        'arabian': 'Arabian',
-        'argentinian': 'Argentinian',
-        'argentine': 'Argentine',
-        'aristotelian': 'Aristotelian',
-        'aryan': 'Aryan',
-        'asian': 'Asian',
-        'atlantic': 'Atlantic',
-        'australian': 'Australian',
-        'austrian': 'Austrian',
-        'baathist': 'Baathist',
-        'bangladeshi': 'Bangladeshi',
-        'bantu': 'Bantu',
-        'belgian': 'Belgian',
-        'bolivar': 'Bolivar',
-        'brazilian': 'Brazilian',
-        'british': 'British',
-        'buddhist': 'Buddhist',
-        'byzantian': 'Byzantian',
-        'calvinist': 'Calvinist',
-        'canadian': 'Canadian',
-        'carribean': 'Carribean',
-        'catholic': 'Catholic',
-        'caucasian': 'Caucasian',
-        'chilean': 'Chilean',
-        'chinese': 'Chinese',
-        'christian': 'Christian',
-        'conservative': ['conservative', 'Conservative'],
-        'cuban': 'Cuban',
-        'czech': 'Czech',
-        'democratic': ['democratic', 'Democratic'],
-        'dutch': 'Dutch',
-        'egyptian': 'Egyptian',
-        'english': 'English',
-        'ethiopian': 'Ethiopian',
-        'european': 'European',
-        'filipino': 'Filipino',
-        'french': 'French',
-        'german': 'German',
-        'greek': 'Greek',
-        'illyrian': 'Illyrian',
-        'indian': 'Indian',
-        'iranian': 'Iranian',
-        'iraqi': 'Iraqi',
-        'irish': 'Irish',
-        'islamic': 'Islamic',
-        'islamist': 'Islamist',
-        'israeli': 'Israeli',
-        'italian': 'Italian',
-        'jamaican': 'Jamaican',
-        'japanese': 'Japanese',
-        'jesuit': 'Jesuit',
-        'jewish': 'Jewish',
-        'jóola': 'Jóola',
-        'jordanian': 'Jordanian',
-        'korean': 'Korean',
-        'kurdish': 'Kurdish',
-        'latin': 'Latin',
-        'lebanese': 'Lebanese',
-        'libertarian': 'Libertarian',
-        'libyan': 'Libyan',
-        'malaysian': 'Malaysian',
-        'masonic': 'Masonic',
-        'mediterranean': 'Mediterranean',
-        'mexican': 'Mexican',
-        'mongolian': 'Mongolian',
-        'moslem': 'Moslem',
-        'muslim': 'Muslim',
-        'nepalese': 'Nepalese',
-        'norwegian': 'Norwegian',
-        'olondrian': 'Olondrian',
-        'ottoman': 'Ottoman',
-        'pachomian': 'Pachomian',
-        'pakistani': 'Pakistani',
-        'palestinian': 'Palestinian',
-        'parisian': 'Parisian',
-        'pashtun': 'Pashtun',
-        'peruvian': 'Peruvian',
-        'philippine': 'Philippine',
-        'polish': 'Polish',
-        'portugese': 'Portugese',
-        'protestant': 'Protestant',
-        'republican': ['republican', 'Republican'],
-        'roman': 'Roman',
-        'romantic': ['romantic', 'Romantic'],
-        'russian': 'Russian',
-        'satanic': 'Satanic',
-        'saudi': 'Saudi',
-        'saxon': 'Saxon',
-        'scottish': 'Scottish',
-        'shakespearean': 'Shakespearean',
-        'shiite': 'Shiite',
-        'siamese': 'Siamese',
-        'sicilian': 'Sicilian',
-        'sinhala': 'Sinhala',
-        'sinhalese': 'Sinhalese',
-        'slovenian': 'Slovenian',
-        'soviet': 'Soviet',
-        'spanish': 'Spanish',
-        'stuart': 'Stuart',
-        'sunni': 'Sunni',
-        'swedish': 'Swedish',
-        'swiss': 'Swiss',
-        'syrian': 'Syrian',
-        'taiwanese': 'Taiwanese',
-        'tamil': 'Tamil',
-        'tarahumara': 'Tarahumara',
-        'thai': 'Thai',
-        'trinidadian': 'Trinidadian',
-        'turkish': 'Turkish',
-        'venezuelan': 'Venezuelan',
-        'victorian': 'Victorian',
-        'vietnamese': 'Vietnamese',
-        'wahhabi': 'Wahhabi',
-    },
-    'JJR': {  # adjectives, comparative
-        # irregular
-        'better': 'good',
-        'elder': 'old',  # eld/eald in Old English ~ older [old], elder [ancient] split in Modern English
-        'farther': 'far',
-        'further': 'far',
-        'worse': 'bad',
-        # -er exceptions
-        'closer': 'close',
-        'denser': 'dense',
-        'larger': 'large',
-        'ruder': 'rude',
-        'simpler': 'simple',
-        'stranger': 'strange',
-    },
-    'JJS': {  # adjectives, superlative
-        # irregular
-        'best': 'good',
-        'eldest': 'old',  # eld/eald in Old English ~ oldest [old], eldest [ancient] split in Modern English
-        'farthest': 'far',
-        'furthest': 'far',
-        'worst': 'bad',
-        # -est exceptions
-        'ablest': 'able',
-        'closest': 'close',
-        'largest': 'large',
-        'rudest': 'rude',
-        'simplest': 'simple',
-        'surest': 'sure',
-    },
-    'MD': {  # verb, modal
-        'wilt': 'will',
-        # clitics
-        '\'d': 'would', # See https://github.com/UniversalDependencies/UD_English-EWT/issues/450 for modal "would" not lemmatizing to "will".
-        '\'ll': 'will',
-        # multi-word tokens
-        'ca': 'can',  # ca|n't
-        'wo': 'will',  # wo|n't
-    },
-    'NN/Abbr=Yes': {  # noun abbreviations
-        'ED.': ['edition', 'editor'],
-        'NO.': 'number',
-        'P.': 'page',
-        'VOL.': 'volume',
-        # units
-        'cm': 'centimeter',
-        'hr': 'hour',
-        'mcg': 'microgram',
-        'mg': 'milligram',
-        'min': 'minutes',
-        'yr': 'year',
-        # multi-word
-        'A.M.': 'a.m.',  # ante meridiem (before noon)
-        'P.M.': 'p.m.',  # post meridiem (after noon)
-    },
-    'NNS/Number=Plur/Abbr=Yes': {  # noun abbreviations, plural
-        # units
-        'cm': 'centimeter',
-        'hrs': 'hour',
-        'min': 'minute',
-        'mins': 'minute',
-        'ppl': 'person',
-        'yrs': 'year',
-    },
-    'NNP/Abbr=Yes': {  # proper noun abbreviations
-        'AVE': 'Avenue',
-        'CAL': 'California',
-        'DR': ['Doctor', 'Drive'],  # before noun; after noun
-        'INC': 'Incorporated',
-        'JR': 'Junior',
-        'MR': 'Mister',
-        'MRS': 'Mistress',
-        'MT': 'Mount',
-        'OP': 'Opus',
-        'PROF': 'Professor',
-        'ST': ['Saint', 'Street'],  # before noun; after noun
-        # days of the week
-        'MON': 'Monday',
-        'TUE': 'Tuesday',
-        'TUES': 'Tuesday',
-        'WED': 'Wednesday',
-        'THU': 'Thursday',
-        'THUR': 'Thursday',
-        'FRI': 'Friday',
-        'SAT': 'Saturday',
-        'SUN': 'Sunday',
-        # months of the year
-        'JAN': 'January',
-        'FEB': 'February',
-        'MAR': 'March',
-        'APR': 'April',
-        'JUN': 'June',
-        'JUL': 'July',
-        'AUG': 'August',
-        'SEP': 'September',
-        'SEPT': 'September',
-        'OCT': 'October',
-        'NOV': 'November',
-        'DEC': 'December',
-    },
-    'NNS/Number=Plur': { # plural nouns
-        # irregular
-        'alumni': 'alumnus',
-        'antipasti': 'antipasto',
-        'criteria': 'criterion',
-        'data': 'datum',
-        'feet': 'foot',
-        'media': 'medium',
-        'mice': 'mouse',
-        'people': 'person',
-        'phenomena': 'phenomenon',
-        'stimuli': 'stimulus',
-        'teeth': 'tooth',
-        # singular and plural -- not plural only (plurale tantum), so shouldn't use Number=Ptan
-        'series': 'series',
-        'species': 'species',
-        # uncountable -- not plural only (plurale tantum), so shouldn't use Number=Ptan
-        'economics': 'economics',
-        'news': 'news',
-        # -s exceptions
-        'analyses': 'analysis',
-        'appendices': 'appendix',
-        'bases': ['base', 'basis'],
-        'biases': 'bias',
-        'buses': 'bus',
-        'cacti': 'cactus',
-        'calves': 'calf',
-        'censuses': 'census',
-        'codices': 'codex',
-        'concerti': 'concerto',
-        'corpora': 'corpus',
-        'crises': 'crisis',
-        'gases': 'gas',
-        'geniuses': 'genius',
-        'halves': 'half',
-        'hooves': 'hoof',
-        'hypotheses': 'hypothesis',
-        'indices': 'index',
-        'knives': 'knife',
-        'lives': 'life',
-        'leaves': 'leaf',
-        'loaves': 'loaf',
-        'potatoes': 'potato',
-        'quizzes': 'quiz',
-        'shelves': 'shelf',
-        'sinuses': 'sinus',
-        'surpluses': 'surplus',
-        'syntheses': 'synthesis',
-        'taxes': ['tax', 'taxis'],
-        'thieves': 'thief',
-        'tomatoes': 'tomato',
-        'volcanoes': 'volcano',
-        'wives': 'wife',
-        'wolves': 'wolf',
-        'zeroes': 'zero',
-        # -ches exceptions
-        'aches': 'ache',
-        'caches': 'cache',
-        'headaches': 'headache',
-        'heartaches': 'heartache',
-        'niches': 'niche',
-        # -ies exceptions
-        'budgies': 'budgie',
-        'cookies': 'cookie',
-        'hippies': 'hippie',
-        'kiddies': 'kiddie',
-        'lies': 'lie',
-        'monies': 'money',
-        'movies': 'movie',
-        'newbies': 'newbie',
-        'pies': 'pie',
-        'pinkies': 'pinkie',
-        'pixies': 'pixie',
-        'ties': 'tie',
-        'yachties': 'yachtie',
-    },
-    'POS': {  # possessive
-        '\'': '\'s',
-    },
-    'PRP': {  # pronoun, personal
-        '\'s': 'we',  # let's -> let us
-        # Nominative : https://universaldependencies.org/en/pos/PRON.html#personal-pronouns
-        'i': 'I',
-        'me': 'I',
-        'us': 'we',
-        'thee': 'thou',
-        'him': 'he',
-        'her': 'she',
-        'them': 'they',
-        # Independent Possessive : https://universaldependencies.org/en/pos/PRON.html#personal-pronouns
-        'mine': 'my',
-        'ours': 'our',
-        'yours': 'your',
-        'thine': 'thy',
-        'hers': 'her',
-        'theirs': 'their',
-    },
-    'RB': {  # adverbs
-        # PART
-        'n': 'not',
-        'n\'t': 'not',
-        'n`t': 'not',
-        'nt': 'not',
-    },
-    'RB/Abbr=Yes': {  # adverb abbreviations
-        'AKA': 'a.k.a.',  # also known as
-    },
-    'RBR': {  # adverb, comparative
-        # irregular
-        'better': 'well',
-        'farther': 'far',
-        'further': 'far',
-        'less': 'little',
-        'lesser': 'little',
-        'worse': 'bad',
-        # -er exceptions
-        'closer': 'close',
-    },
-    'RBS': {  # adverb, superlative
-        # irregular
-        'best': 'well',
-        'farthest': 'far',
-        'furthest': 'far',
-        'least': 'little',
-        'worst': 'bad',
-    },
-    'SYM': {  # symbol
-        '\u2013': '\u002D',  # EN DASH -> HYPHEN-MINUS
-        '\u2014': '\u002D',  # EM DASH -> HYPHEN-MINUS
-    },
-    'TO/Abbr=Yes': { # PART+TO -- "to"
-        'a': 'to',  # ought|a, etc.
-        'na': 'to',  # wan|na, etc.
-        'ta': 'to',  # got|ta, etc.
-    },
-    'UH': {  # interjection
-        'christ': 'Christ',
-    },
-    'VB': {  # verb, base form
-        # clitics
-        '\'ve': 'have',
-        # multi-word tokens
-        'no': 'know',  # du|n|no
-        'wan': 'want',  # wan|na
-    },
-    'VBD': {  # verb, past tense
-        # clitics
-        '\'d': ['do', 'have'],  # did, had
-        # irregular
-        'arose': 'arise',
-        'ate': 'eat',
-        'bade': 'bid',
-        'bore': 'bear',
-        'bent': 'bend',
-        'became': 'become',
-        'began': 'begin',
-        'betook': 'betake',
-        'bit': 'bite',
-        'blew': 'blow',
-        'bought': 'buy',
-        'bred': 'breed',
-        'broke': 'break',
-        'brought': 'bring',
-        'built': 'build',
-        'caught': 'catch',
-        'came': 'come',
-        'chose': 'choose',
-        'clung': 'cling',
-        'co-wrote': 'co-write',
-        'cowrit': 'cowrite',
-        'crept': 'creep',
-        'cross-bred': 'cross-breed',
-        'crossbred': 'crossbreed',
-        'de-froze': 'de-freeze',
-        'dealt': 'deal',
-        'did': 'do',
-        'died': 'die',
-        'drank': 'drink',
-        'drew': 'draw',
-        'drove': 'drive',
-        'dwelt': 'dwell',
-        'fed': 'feed',
-        'fell': 'fall',
-        'felt': 'feel',
-        'fled': 'flee',
-        'flew': 'fly',
-        'flung': 'fling',
-        'forbade': 'forbid',
-        'foresaw': 'foresee',
-        'forgave': 'forgive',
-        'forgot': 'forget',
-        'fought': 'fight',
-        'found': 'find',
-        'froze': 'freeze',
-        'gave': 'give',
-        'got': 'get',
-        'grew': 'grow',
-        'had': 'have',
-        'happend': 'happen',
-        'heard': 'hear',
-        'held': 'hold',
-        'hid': 'hide',
-        'hung': 'hang',
-        'kept': 'keep',
-        'knelt': 'kneel',
-        'knew': 'know',
-        'laid': 'lay',
-        'lay': 'lie',
-        'led': 'lead',
-        'leant': 'lean',
-        'learnt': 'learn',
-        'left': 'leave',
-        'lit': 'light',
-        'lost': 'lose',
-        'made': 'make',
-        'meant': 'mean',
-        'met': 'meet',
-        'mistook': 'mistake',
-        'outshone': 'outshine',
-        'overheard': 'overhear',
-        'overran': 'overrun',
-        'overseen': 'oversee',  # past participle or non-standard past tense
-        'overthrew': 'overthrow',
-        'overtook': 'overtake',
-        'paid': 'pay',
-        'pre-made': 'pre-make',
-        'prepaid': 'prepay',
-        'ran': 'run',
-        'rang': 'ring',
-        'rebuilt': 'rebuild',
-        'retook': 'retake',
-        'rid': ['rid', 'ride'],
-        'rode': 'ride',
-        'rose': 'rise',
-        'said': 'say',
-        'sang': 'sing',
-        'sank': 'sink',
-        'sat': 'sit',
-        'saw': 'see',
-        'seen': 'see',  # past participle or non-standard past tense
-        'sent': 'send',
-        'shone': 'shine',
-        'shook': 'shake',
-        'shot': 'shoot',
-        'shrunk': 'shrink',
-        'slept': 'sleep',
-        'slid': 'slide',
-        'slung': 'sling',
-        'snuck': 'sneak',
-        'sold': 'sell',
-        'sought': 'seek',
-        'sped': 'speed',
-        'squoze': 'squeeze',
-        'stole': 'steal',
-        'stood': 'stand',
-        'struck': 'strike',
-        'spent': 'spend',
-        'spoke': 'speak',
-        'sprang': 'spring',
-        'stuck': 'stick',
-        'stunk': 'stink',
-        'sunk': 'sink',
-        'swam': 'swim',
-        'swept': 'sweep',
-        'swore': 'swear',
-        'swung': 'swing',
-        'taught': 'teach',
-        'thought': 'think',
-        'threw': 'throw',
-        'told': 'tell',
-        'took': 'take',
-        'trod': ['trod', 'tread'],
-        'understood': 'understand',
-        'undertook': 'undertake',
-        'underwent': 'undergo',
-        'was': 'be',
-        'went': 'go',
-        'were': 'be',
-        'withdrew': 'withdraw',
-        'woke': 'wake',
-        'won': 'win',
-        'wore': 'wear',
-        'wound': 'wind',
-        'writ': 'write',
-        'wrote': 'write',
-        'wrought': 'wring',
-        # -ed exceptions
-        'added': 'add',
-        'coalesced': 'coalesce',
-        'eyed': 'eye',
-    },
-    'VBG': {  # verb, gerund or present tense
-        # -ing exceptions
-        'being': 'be',
-        'eyeing': 'eye',
-        'eying': 'eye',
-        'having': 'have',
-        'coalescing': 'coalesce',
-    },
-    'VBN': {  # verb, past participle
-        # irregular
-        'been': 'be',
-        'begun': 'begin',
-        'born': 'bear',
-        'bound': 'bind',
-        'done': 'do',
-        'flown': 'fly',
-        'foretold': 'foretell',
-        'forgone':'forgo',
-        'gone': 'go',
-        'spoilt': 'spoil',
-        'sprung': 'spring',
-        'sung': 'sing',
-        'sworn': 'swear',
-        'torn': 'tear',
-        'undergone': 'undergo',
-        'worn': 'wear',
-        'wrung': 'wring',
-    },
-    'VBP': {  # verb, singular present
-        # clitics
-        '\'m': 'be',  # am
-        '\'re': 'be',  # are
-        '\'s': 'be',  # is
-        '\'ve': 'have',
-        # irregular
-        'am': 'be',
-        'are': 'be',
-        'art': 'be',
-        'is': 'be',
-        'were': 'be',
-        # multi-word tokens
-        'ai': 'be',  # ai|n't
-        'du': 'do',  # du|n|no
-    },
-    'VBZ': {  # verb, singular present, third person
-        # clitics
-        '\'s': ['be', 'have'],  # is, has
-        # irregular
-        'is': 'be',
-        'does': 'do',
-        'has': 'have',
-        'hath': 'have',
-        # multi-word tokens
-        'ai': 'be',  # is
-        # -es exceptions
-        'coalesces': 'coalesce',
-        'eyes': 'eye',
-    },
-    'WP': {  # pronoun, possessive wh-
-        # https://universaldependencies.org/en/pos/PRON.html#relativeinterrogative-wh-pronouns
-        'whom': 'who',
-        'whomever': 'whoever',
-    },
-}
+])
 
 normalization_rules = [
     ('’', '\''),
@@ -891,71 +367,103 @@ normalization_rules = [
 ]
 
 
+def expected_lemma(lemma_type, form):
+    rule = lemmatization_rule_names[lemma_type]
+    normalized_form, expected_lemma = lemmatization_rules[rule](form)
+
+    if 'Abbr=Yes' in lemma_type and form.endswith('.'):
+        # check the abbreviation without the trailing '.'
+        exception = lemma_exception_index.get((lemma_type, normalized_form[:-1]))
+        if exception is not None:
+            return 'lemma-exception', exception[1]
+
+    exception = lemma_exception_index.get((lemma_type, normalized_form))
+    if lemma_type == 'VBN' and form.endswith('en') and (exception is None or exception[0] == 'VBD'):
+        # VBN + -en => VBD => VB : e.g. hidden => hid => hide
+        stem_exception = lemma_exception_index.get(('VBD', expected_lemma))
+        if stem_exception is not None:
+            return 'lemma-exception', stem_exception[1]
+
+    if exception is not None:
+        # use the exception lemma instead of the rule-based lemma
+        return 'lemma-exception', exception[1]
+    return rule, expected_lemma
+
+
+def build_lemma_type(upos, xpos, number, num_form, num_type, abbr, has_correct_form):
+    lemma_type = xpos
+
+    if xpos in ['NNS', 'NNPS']:
+        # https://universaldependencies.org/u/feat/Number.html
+        if number is not None:
+            lemma_type = f"{lemma_type}/Number={number}"
+    elif xpos == 'CD':
+        # https://universaldependencies.org/u/feat/NumForm.html
+        # https://universaldependencies.org/u/feat/NumType.html
+        if num_form == 'Digit' and num_type is not None:
+            lemma_type = f"{lemma_type}/NumForm={num_form}/NumType={num_type}"
+        elif num_form is not None:
+            lemma_type = f"{lemma_type}/NumForm={num_form}"
+        elif num_form is None and num_type is None:
+            # https://universaldependencies.org/en/pos/PRON.html#reciprocal-pronouns
+            lemma_type = f"{lemma_type}+{upos}"
+
+    # https://universaldependencies.org/u/feat/Abbr.html
+    # https://universaldependencies.org/misc.html#correctform
+    if abbr is not None and not has_correct_form:
+        lemma_type = f"{lemma_type}/Abbr={abbr}"
+
+    return lemma_type
+
+
 class TokenLemmaValidator(Validator):
-    def __init__(self, language):
+    name = 'lemma'
+    fields = ['form', 'lemma', 'upos', 'xpos', 'deprel', 'feats', 'misc']
+    rules = {
+        'missing-lemma': LogLevel.ERROR,
+        'lemma-mismatch': LogLevel.ERROR,
+        'missing-lemma-rule': LogLevel.WARN,
+    }
+
+    def __init__(self, language, cache_size=65536):
         super().__init__(language)
+        rulepacks.load_rule_packs()
+        # The expected lemmas for the (lemma type, form) pairs, as the forms are often repeated.
+        self.expected_lemma = functools.lru_cache(maxsize=cache_size)(expected_lemma)
+        # The lemma types for the (upos, xpos, Number, NumForm, NumType, Abbr, has CorrectForm) values.
+        self.lemma_types = {}
+        self.check_lemma = True
+        self.check_missing_rule = True
+
+    def cache_info(self):
+        return self.expected_lemma.cache_info()
+
+    def validate_sentence(self, sent):
+        # Skip building the lemma types and expected lemmas for disabled rules.
+        self.check_lemma = logger.enabled(LogLevel.ERROR, 'lemma-mismatch')
+        self.check_missing_rule = logger.enabled(LogLevel.WARN, 'missing-lemma-rule')
+        super().validate_sentence(sent)
 
     def get_lemma_type(self, token):
-        upos = token['upos']
-        xpos = token['xpos']
-        lemma_type = xpos
-
-        if xpos in ['NNS', 'NNPS']:
-            # https://universaldependencies.org/u/feat/Number.html
-            number = conllutil.get_feat(token, 'Number', None)
-            if number is not None:
-                lemma_type = f"{lemma_type}/Number={number}"
-        elif xpos == 'CD':
-            # https://universaldependencies.org/u/feat/NumForm.html
-            # https://universaldependencies.org/u/feat/NumType.html
-            num_form = conllutil.get_feat(token, 'NumForm', None)
-            num_type = conllutil.get_feat(token, 'NumType', None)
-            if num_form == 'Digit' and num_type is not None:
-                lemma_type = f"{lemma_type}/NumForm={num_form}/NumType={num_type}"
-            elif num_form is not None:
-                lemma_type = f"{lemma_type}/NumForm={num_form}"
-            elif num_form is None and num_type is None:
-                # https://universaldependencies.org/en/pos/PRON.html#reciprocal-pronouns
-                lemma_type = f"{lemma_type}+{upos}"
-
-        # https://universaldependencies.org/u/feat/Abbr.html
-        # https://universaldependencies.org/misc.html#correctform
-        abbr = conllutil.get_feat(token, 'Abbr', None)
-        correct_form = conllutil.get_misc(token, 'CorrectForm', None)
-        if abbr is not None and (correct_form is None or correct_form == '_'):
-            lemma_type = f"{lemma_type}/Abbr={abbr}"
-
-        return lemma_type
+        feats = conllutil.get_field(token, 'feats', conllutil.no_fields)
+        misc = conllutil.get_field(token, 'misc', conllutil.no_fields)
+        signature = (token['upos'], token['xpos'],
+                     feats.get('Number'), feats.get('NumForm'), feats.get('NumType'), feats.get('Abbr'),
+                     misc.get('CorrectForm', '_') not in (None, '_'))
+        try:
+            return self.lemma_types[signature]
+        except KeyError:
+            lemma_type = build_lemma_type(*signature)
+            self.lemma_types[signature] = lemma_type
+            return lemma_type
 
     def match_lemma(self, lemma, expected_lemma):
         if isinstance(expected_lemma, list):
             return lemma in expected_lemma
         return lemma == expected_lemma
 
-    def validate_lemma(self, sent, token, rule, form, lemma, lemma_type):
-        normalized_form, expected_lemma = lemmatization_rules[rule](form)
-
-        if lemma_type == 'VBN':
-            if form.endswith('en') and expected_lemma in lemma_exceptions['VBD']:
-                # VBN + -en => VBD => VB : e.g. hidden => hid => hide
-                rule = 'lemma-exception'
-                expected_lemma = lemma_exceptions['VBD'][expected_lemma]
-            elif normalized_form in lemma_exceptions['VBD']:
-                # use VBD for other lemma exceptions
-                rule = 'lemma-exception'
-                expected_lemma = lemma_exceptions['VBD'][normalized_form]
-
-        if lemma_type in lemma_exceptions and normalized_form in lemma_exceptions[lemma_type]:
-            # use the exception lemma instead of the rule-based lemma
-            rule = 'lemma-exception'
-            expected_lemma = lemma_exceptions[lemma_type][normalized_form]
-
-        if 'Abbr=Yes' in lemma_type and form.endswith('.'):
-            abbr_form = normalized_form[:-1]
-            # check the abbreviation without the trailing '.'
-            if lemma_type in lemma_exceptions and abbr_form in lemma_exceptions[lemma_type]:
-                rule = 'lemma-exception'
-                expected_lemma = lemma_exceptions[lemma_type][abbr_form]
+    def validate_lemma(self, sent, token, form, lemma, lemma_type):
+        rule, expected_lemma = self.expected_lemma(lemma_type, form)
 
         if self.match_lemma(lemma, expected_lemma):
             pass  # matched via lemmatization rule
@@ -963,7 +471,9 @@ class TokenLemmaValidator(Validator):
             if isinstance(expected_lemma, list):
                 expected_lemma = '|'.join(expected_lemma)
             log(LogLevel.ERROR, sent, token,
-                f"{lemma_type} lemma '{lemma}' does not match {rule} applied to form '{form}', expected '{expected_lemma}'")
+                "{lemma_type} lemma '{actual}' does not match {lemma_rule} applied to form '{form}', expected '{expect}'",
+                expect=expected_lemma, actual=lemma, rule='lemma-mismatch',
+                lemma_type=lemma_type, lemma_rule=rule, form=form)
 
     def validate_token(self, sent, token):
         form = conllutil.correct_form(token)
@@ -973,14 +483,17 @@ class TokenLemmaValidator(Validator):
                 return  # goeswith have `_` as the lemma
             if lemma == '_' and token['xpos'] == 'NFP':
                 return  # underscore as an actual lemma, not a missing entry
-            log(LogLevel.ERROR, sent, token, f"missing lemma text")
+            log(LogLevel.ERROR, sent, token, "missing lemma text", rule='missing-lemma')
             return
         if form is None:
             return  # Missing form text is reported by the 'form' validator.
+        if not self.check_lemma and not self.check_missing_rule:
+            return
 
         lemma_type = self.get_lemma_type(token)
         if lemma_type in lemmatization_rule_names:
-            rule = lemmatization_rule_names[lemma_type]
-            self.validate_lemma(sent, token, rule, form, lemma, lemma_type)
-        elif lemma_type not in ['FW', 'GW']:  # ignore foreign word (FW) and grouped word (GW) lemmas
-            log(LogLevel.WARN, sent, token, f"{lemma_type} lemma '{lemma}' does not have a validation rule for form '{form}'")
+            if self.check_lemma:
+                self.validate_lemma(sent, token, form, lemma, lemma_type)
+        elif self.check_missing_rule and lemma_type not in ['FW', 'GW']:  # ignore foreign word (FW) and grouped word (GW) lemmas
+            log(LogLevel.WARN, sent, token, "{lemma_type} lemma '{actual}' does not have a validation rule for form '{form}'",
+                actual=lemma, rule='missing-lemma-rule', lemma_type=lemma_type, form=form)
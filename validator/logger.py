@@ -1,6 +1,12 @@
 # Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
 
-error_count = 0
+import abc
+import collections
+import contextlib
+import contextvars
+import json
+import sys
+import threading
 
 
 class LogLevel:
@@ -8,18 +14,210 @@ class LogLevel:
     WARN = 'WARN'
 
 
-def log(level, sent, token, message, expect=None, actual=None):
-    if level == LogLevel.ERROR:
-        global error_count
-        error_count = error_count + 1
+levels = {
+    LogLevel.WARN: 0,
+    LogLevel.ERROR: 1,
+}
 
-    if token is None:
-        print(f"{level}: Sentence {sent.metadata['sent_id']} -- {message}")
-    elif isinstance(token['id'], int):
-        print(f"{level}: Sentence {sent.metadata['sent_id']} token {token['id']} -- {message}")
-    else:
-        print(f"{level}: Sentence {sent.metadata['sent_id']} token {token['id'][0]}-{token['id'][2]} -- {message}")
 
-    if expect is not None and actual is not None:
-        print(f"... Expect: {expect}")
-        print(f"... Actual: {actual}")
+def format_token_id(token_id):
+    if token_id is None or isinstance(token_id, int):
+        return token_id
+    return f"{token_id[0]}{token_id[1]}{token_id[2]}"
+
+
+class Diagnostic:
+    __slots__ = ('level', 'sent_id', 'token_id', 'validator', 'rule', 'message', 'expect', 'actual', 'values')
+
+    def __init__(self, level, sent_id, token_id, validator, rule, message, expect=None, actual=None, values=None):
+        self.level = level
+        self.sent_id = sent_id
+        self.token_id = token_id
+        self.validator = validator
+        self.rule = rule
+        self.message = message  # A str.format template using the expect, actual, and values fields.
+        self.expect = expect
+        self.actual = actual
+        self.values = values
+
+    def format_message(self):
+        if self.values is None:
+            return self.message.format(expect=self.expect, actual=self.actual)
+        return self.message.format(expect=self.expect, actual=self.actual, **self.values)
+
+    def to_dict(self):
+        fields = {
+            'level': self.level,
+            'sent_id': self.sent_id,
+            'token_id': format_token_id(self.token_id),
+            'validator': self.validator,
+            'rule': self.rule,
+            'message': self.format_message(),
+            'expect': self.expect,
+            'actual': self.actual,
+        }
+        if self.values is not None:
+            for key, value in self.values.items():
+                fields.setdefault(key, value)
+        return fields
+
+
+class BufferedSink(abc.ABC):
+    # The diagnostics are written when buffer_size of them have been formatted, and when the
+    # sink is flushed. The default of 1 writes each diagnostic as it is emitted, so nothing is
+    # lost if the sink is not flushed, e.g. when the validators are used as a library.
+    def __init__(self, stream=None, buffer_size=1):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.buffer = []
+
+    @abc.abstractmethod
+    def format(self, diagnostic):
+        pass
+
+    def emit(self, diagnostic):
+        self.buffer.append(self.format(diagnostic))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if len(self.buffer) == 0:
+            return
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write(''.join(self.buffer))
+        self.buffer = []
+
+
+class TextSink(BufferedSink):
+    def format(self, diagnostic):
+        token_id = diagnostic.token_id
+        message = diagnostic.format_message()
+        if token_id is None:
+            text = f"{diagnostic.level}: Sentence {diagnostic.sent_id} -- {message}\n"
+        elif isinstance(token_id, int):
+            text = f"{diagnostic.level}: Sentence {diagnostic.sent_id} token {token_id} -- {message}\n"
+        else:
+            text = f"{diagnostic.level}: Sentence {diagnostic.sent_id} token {token_id[0]}-{token_id[2]} -- {message}\n"
+
+        # Show the expected and actual values if they are not part of the message.
+        if diagnostic.expect is not None and diagnostic.actual is not None and '{expect}' not in diagnostic.message:
+            text = f"{text}... Expect: {diagnostic.expect}\n... Actual: {diagnostic.actual}\n"
+        return text
+
+
+class JsonLinesSink(BufferedSink):
+    def format(self, diagnostic):
+        return json.dumps(diagnostic.to_dict(), ensure_ascii=False) + '\n'
+
+
+class CollectorSink:
+    def __init__(self):
+        self.diagnostics = []
+
+    def emit(self, diagnostic):
+        self.diagnostics.append(diagnostic)
+
+    def flush(self):
+        pass
+
+
+sinks = {
+    'text': TextSink,
+    'jsonl': JsonLinesSink,
+}
+
+
+class Filter:
+    def __init__(self, min_level=LogLevel.WARN, disabled_rules=()):
+        self.min_level = levels[min_level]
+        self.disabled_rules = frozenset(disabled_rules)
+
+    def enabled(self, level, rule=None):
+        return levels[level] >= self.min_level and rule not in self.disabled_rules
+
+
+class RunContext:
+    def __init__(self, sink=None, log_filter=None):
+        self.sink = TextSink() if sink is None else sink
+        self.filter = Filter() if log_filter is None else log_filter
+        self.validator = None  # The name of the validator that is currently running.
+        self.counts = collections.Counter()  # (level, validator, rule) => count
+        self.lock = threading.Lock()
+
+    def enabled(self, level, rule=None):
+        return self.filter.enabled(level, rule)
+
+    def emit(self, diagnostic):
+        key = (diagnostic.level, diagnostic.validator, diagnostic.rule)
+        # The sinks are not thread-safe, so the diagnostic is written under the lock.
+        with self.lock:
+            self.counts[key] += 1
+            self.sink.emit(diagnostic)
+
+    def merge(self, counts):
+        # Add the counts from a RunContext used in another thread or process.
+        with self.lock:
+            self.counts.update(counts)
+
+    def count(self, level):
+        with self.lock:
+            return sum(count for (count_level, _, _), count in self.counts.items() if count_level == level)
+
+    def count_by_validator(self, level):
+        counts = collections.Counter()
+        with self.lock:
+            for (count_level, validator, _), count in self.counts.items():
+                if count_level == level:
+                    counts[validator] += count
+        return counts
+
+    def count_by_rule(self, level):
+        counts = collections.Counter()
+        with self.lock:
+            for (count_level, _, rule), count in self.counts.items():
+                if count_level == level:
+                    counts[rule] += count
+        return counts
+
+    def error_count(self):
+        return self.count(LogLevel.ERROR)
+
+    def warning_count(self):
+        return self.count(LogLevel.WARN)
+
+
+current_context = contextvars.ContextVar('current_context')
+
+
+def get_context():
+    context = current_context.get(None)
+    if context is None:
+        # Nothing flushes the default context, e.g. when the validators are used as a library,
+        # so its sink writes each diagnostic as it is emitted.
+        context = RunContext(TextSink(buffer_size=1))
+        current_context.set(context)
+    return context
+
+
+@contextlib.contextmanager
+def run_context(sink=None, log_filter=None):
+    context = RunContext(sink, log_filter)
+    token = current_context.set(context)
+    try:
+        yield context
+    finally:
+        with context.lock:
+            context.sink.flush()
+        current_context.reset(token)
+
+
+def enabled(level, rule=None):
+    return get_context().filter.enabled(level, rule)
+
+
+def log(level, sent, token, message, expect=None, actual=None, rule=None, **values):
+    context = get_context()
+    if not context.filter.enabled(level, rule):
+        return
+    context.emit(Diagnostic(level, sent.metadata['sent_id'], None if token is None else token['id'],
+                            context.validator, rule, message, expect, actual, values or None))
@@ -1,192 +1,14 @@
 # Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
 
-from conllu.models import Token
+import collections
 
 from validator import conllutil
+from validator import rulepacks
+from validator.rulepacks import mwt_suffixes
 from validator.validator import Validator, MwtValidator
 from validator.logger import log, LogLevel
 
 
-mwt_suffixes = {
-    '\'d': {
-        # See https://github.com/UniversalDependencies/UD_English-EWT/issues/450 for modal "would" not lemmatizing to "will".
-        'everyone': [Token(form='everyone', lemma='everyone'), Token(form='\'d', lemma=['have', 'would'])],  # everyone had, everyone would
-        'he': [Token(form='he', lemma='he'), Token(form='\'d', lemma=['have', 'would'])],  # he had, he would
-        'how': [Token(form='how', lemma='how'), Token(form='\'d', lemma=['have', 'would'])],  # how had, how would
-        'I': [Token(form='I', lemma='I'), Token(form='\'d', lemma=['have', 'would'])],  # I had, I would
-        'it': [Token(form='it', lemma='it'), Token(form='\'d', lemma=['have', 'would'])],  # it had, it would
-        'she': [Token(form='she', lemma='she'), Token(form='\'d', lemma=['have', 'would'])],  # she had, she would
-        'that': [Token(form='that', lemma='that'), Token(form='\'d', lemma=['have', 'would'])],  # that had, that would
-        'there': [Token(form='there', lemma='there'), Token(form='\'d', lemma=['have', 'would'])],  # there had, there would
-        'they': [Token(form='they', lemma='they'), Token(form='\'d', lemma=['have', 'would'])],  # they had, they would
-        'we': [Token(form='we', lemma='we'), Token(form='\'d', lemma=['have', 'would'])],  # we had, we would
-        'what': [Token(form='what', lemma='what'), Token(form='\'d', lemma=['do', 'have', 'would'])],  # what did, what had, what would
-        'where': [Token(form='where', lemma='where'), Token(form='\'d', lemma=['have', 'would'])],  # where had, where would
-        'who': [Token(form='who', lemma='who'), Token(form='\'d', lemma=['have', 'would'])],  # who had, who would
-        'why': [Token(form='why', lemma='why'), Token(form='\'d', lemma=['have', 'would'])],  # why had, why would
-        'y': [Token(form='y', lemma='you'), Token(form='\'d', lemma=['have', 'would'])],  # you had, you would
-        'you': [Token(form='you', lemma='you'), Token(form='\'d', lemma=['have', 'would'])],  # you had, you would
-        None: [Token(upos=['NOUN', 'PROPN']), Token(form='\'d', lemma=['have', 'would'])],  # _ had, _ would
-    },
-    '\'ll': {
-        'good': [Token(form='good', lemma='good'), Token(form='\'ll', lemma='will')],  # good will
-        'he': [Token(form='he', lemma='he'), Token(form='\'ll', lemma='will')],  # he will
-        'I': [Token(form='I', lemma='I'), Token(form='\'ll', lemma='will')],  # I will
-        'it': [Token(form='it', lemma='it'), Token(form='\'ll', lemma='will')],  # it will
-        'nobody': [Token(form='nobody', lemma='nobody'), Token(form='\'ll', lemma='will')],  # nobody will
-        'she': [Token(form='she', lemma='she'), Token(form='\'ll', lemma='will')],  # she will
-        'that': [Token(form='that', lemma='that'), Token(form='\'ll', lemma='will')],  # that will
-        'there': [Token(form='there', lemma='there'), Token(form='\'ll', lemma='will')],  # there will
-        'they': [Token(form='they', lemma='they'), Token(form='\'ll', lemma='will')],  # they will
-        'this': [Token(form='this', lemma='this'), Token(form='\'ll', lemma='will')],  # this will
-        'we': [Token(form='we', lemma='we'), Token(form='\'ll', lemma='will')],  # we will
-        'what': [Token(form='what', lemma='what'), Token(form='\'ll', lemma='will')],  # what will
-        'where': [Token(form='where', lemma='where'), Token(form='\'ll', lemma='will')],  # where will
-        'you': [Token(form='you', lemma='you'), Token(form='\'ll', lemma='will')],  # you will
-        None: [Token(upos=['NOUN', 'PROPN']), Token(form='\'ll', lemma='will')],  # _ will
-    },
-    '\'m': {
-        'I': [Token(form='I', lemma='I'), Token(form='\'m', lemma='be')],  # I am
-        'no': [Token(form='no', lemma='no'), Token(form='\'m', lemma='madam')],  # no madam
-        'yes': [Token(form='yes', lemma='yes'), Token(form='\'m', lemma='madam')],  # yes madam
-        None: [Token(upos='VERB'), Token(form='\'m', lemma='they')],  # _ them
-    },
-    '\'n': {
-        None: [Token(), Token(form='\'n', lemma='than')],  # _ than
-    },
-    '\'re': {
-        'they': [Token(form='they', lemma='they'), Token(form='\'re', lemma='be')],  # they are
-        'we': [Token(form='we', lemma='we'), Token(form='\'re', lemma='be')],  # we are
-        'what': [Token(form='what', lemma='what'), Token(form='\'re', lemma='be')],  # what are
-        'where': [Token(form='where', lemma='where'), Token(form='\'re', lemma='be')],  # where are
-        'who': [Token(form='who', lemma='who'), Token(form='\'re', lemma='be')],  # who are
-        'you': [Token(form='you', lemma='you'), Token(form='\'re', lemma='be')],  # you are
-    },
-    '\'s': {
-        'another': [Token(form='another', lemma='another'), Token(form='\'s', lemma='\'s')],  # POS
-        'anybody': [Token(form='anybody', lemma='anybody'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'anyone': [Token(form='anyone', lemma='anyone'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'anything': [Token(form='anything', lemma='anything'), Token(form='\'s', lemma=['\'s', 'be'])],  # POS, anything is
-        'dunno': [Token(form='du', lemma='do'), Token(form='n', lemma='not'), Token(form='no', lemma='know'), Token(form='\'s', lemma='as')],  # do not know as
-        'else': [Token(form='else', lemma='else'), Token(form='\'s', lemma='\'s')],  # POS
-        'everybody': [Token(form='everybody', lemma='everybody'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'everyone': [Token(form='everyone', lemma='everyone'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'everything': [Token(form='everything', lemma='everything'), Token(form='\'s', lemma='be')],  # everything is
-        'good': [Token(form='good', lemma='good'), Token(form='\'s', lemma='be')],  # good is
-        'he': [Token(form='he', lemma='he'), Token(form='\'s', lemma=['be', 'have'])],  # he is, he has
-        'here': [Token(form='here', lemma='here'), Token(form='\'s', lemma='be')],  # here is
-        'how': [Token(form='how', lemma='how'), Token(form='\'s', lemma='be')],  # how is
-        'it': [Token(form='it', lemma='it'), Token(form='\'s', lemma=['be', 'have'])],  # it is, it has
-        'let': [Token(form='let', lemma='let'), Token(form='\'s', lemma='we')],  # let us
-        'many': [Token(form='many', lemma='many'), Token(form='\'s', lemma='be')],  # many is
-        'mine': [Token(form='mine', lemma=['my', 'mine']), Token(form='\'s', lemma='be')],  # mine is
-        'more': [Token(form='more', lemma='more'), Token(form='\'s', lemma='be')],  # more is
-        'nobody': [Token(form='nobody', lemma='nobody'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'nothing': [Token(form='nothing', lemma='nothing'), Token(form='\'s', lemma='be')],  # nothing is
-        'one': [Token(form='one', lemma='one'), Token(form='\'s', lemma=['\'s', 'be'])],  # POS, _ is
-        'other': [Token(form='other', lemma='other'), Token(form='\'s', lemma='\'s')],  # POS
-        'she': [Token(form='she', lemma='she'), Token(form='\'s', lemma=['be', 'have'])],  # she is, she has
-        'so': [Token(form='so', lemma='so'), Token(form='\'s', lemma='be')],  # so is
-        'somebody': [Token(form='somebody', lemma='somebody'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'someone': [Token(form='someone', lemma='someone'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-        'something': [Token(form='something', lemma='something'), Token(form='\'s', lemma='be')],  # something is
-        'that': [Token(form='that', lemma='that'), Token(form='\'s', lemma=['be', 'have'])],  # that is, that has
-        'there': [Token(form='there', lemma='there'), Token(form='\'s', lemma=['be', 'have'])],  # there is, there has
-        'this': [Token(form='this', lemma='this'), Token(form='\'s', lemma='be')],  # this is
-        'what': [Token(form='what', lemma='what'), Token(form='\'s', lemma='be')],  # what is
-        'whatever': [Token(form='whatever', lemma='whatever'), Token(form='\'s', lemma='be')],  # whatever is
-        'when': [Token(form='when', lemma='when'), Token(form='\'s', lemma='be')],  # when is
-        'where': [Token(form='where', lemma='where'), Token(form='\'s', lemma='be')],  # where is
-        'which': [Token(form='which', lemma='which'), Token(form='\'s', lemma='be')],  # which is
-        'who': [Token(form='who', lemma='who'), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, who is, who has
-        'why': [Token(form='why', lemma='why'), Token(form='\'s', lemma='be')],  # why is
-        None: [Token(upos=['NOUN', 'PROPN', 'NUM', 'VERB']), Token(form='\'s', lemma=['\'s', 'be', 'have'])],  # POS, _ is, _ has
-    },
-    '\'un': {
-        'good': [Token(form='good', lemma='good'), Token(form='\'un', lemma='one')],  # good one
-    },
-    '\'ve': {
-        'can\'t': [Token(form='ca', lemma='can'), Token(form='n\'t', lemma='not'), Token(form='\'ve', lemma='have')],  # can not have
-        'could': [Token(form='could', lemma='could'), Token(form='\'ve', lemma='have')],  # could have
-        'I': [Token(form='I', lemma='I'), Token(form='\'ve', lemma='have')],  # I have
-        'might': [Token(form='might', lemma='might'), Token(form='\'ve', lemma='have')],  # might have
-        'must': [Token(form='must', lemma='must'), Token(form='\'ve', lemma='have')],  # must have
-        'probably': [Token(form='probably', lemma='probably'), Token(form='\'ve', lemma='have')],  # probably have
-        'should': [Token(form='should', lemma='should'), Token(form='\'ve', lemma='have')],  # should have
-        'they': [Token(form='they', lemma='they'), Token(form='\'ve', lemma='have')],  # they have
-        'what': [Token(form='what', lemma='what'), Token(form='\'ve', lemma='have')],  # what have
-        'we': [Token(form='we', lemma='we'), Token(form='\'ve', lemma='have')],  # we have
-        'who': [Token(form='who', lemma='who'), Token(form='\'ve', lemma='have')],  # who have
-        'would': [Token(form='would', lemma='would'), Token(form='\'ve', lemma='have')],  # would have
-        'you': [Token(form='you', lemma='you'), Token(form='\'ve', lemma='have')],  # you have
-    },
-    'if': {
-        '\'s': [Token(form='\'s', lemma='as'), Token(form='if', lemma='if')],  # as if
-    },
-    'is': {
-        '\'t': [Token(form='\'t', lemma='it'), Token(form='is', lemma='be')],  # it is
-    },
-    'n\'t': {
-        '\'tai': [Token(form='\'t', lemma='it'), Token(form='ai', lemma='be'), Token(form='n\'t', lemma='not')],  # it is not
-        '\'tis': [Token(form='\'t', lemma='it'), Token(form='is', lemma='be'), Token(form='n\'t', lemma='not')],  # it is not
-        '\'twas': [Token(form='\'t', lemma='it'), Token(form='was', lemma='be'), Token(form='n\'t', lemma='not')],  # it was not
-        'ai': [Token(form='ai', lemma='be'), Token(form='n\'t', lemma='not')],  # are not
-        'are': [Token(form='are', lemma='be'), Token(form='n\'t', lemma='not')],  # are not
-        'c\'d': [Token(form='c\'d', lemma='could'), Token(form='n\'t', lemma='not')],  # could not
-        'ca': [Token(form='ca', lemma='can'), Token(form='n\'t', lemma='not')],  # can not
-        'could': [Token(form='could', lemma='could'), Token(form='n\'t', lemma='not')],  # could not
-        'did': [Token(form='did', lemma='do'), Token(form='n\'t', lemma='not')],  # did not
-        'do': [Token(form='do', lemma='do'), Token(form='n\'t', lemma='not')],  # do not
-        'does': [Token(form='does', lemma='do'), Token(form='n\'t', lemma='not')],  # does not
-        'had': [Token(form='had', lemma='have'), Token(form='n\'t', lemma='not')],  # had not
-        'hai': [Token(form='hai', lemma='have'), Token(form='n\'t', lemma='not')],  # has not, have not
-        'has': [Token(form='has', lemma='have'), Token(form='n\'t', lemma='not')],  # has not
-        'have': [Token(form='have', lemma='have'), Token(form='n\'t', lemma='not')],  # have not
-        'is': [Token(form='is', lemma='be'), Token(form='n\'t', lemma='not')],  # is not
-        'may': [Token(form='may', lemma='may'), Token(form='n\'t', lemma='not')],  # may not
-        'might': [Token(form='might', lemma='might'), Token(form='n\'t', lemma='not')],  # might not
-        'mus': [Token(form='mus', lemma='must'), Token(form='n\'t', lemma='not')],  # must not
-        'must': [Token(form='must', lemma='must'), Token(form='n\'t', lemma='not')],  # must not
-        'need': [Token(form='need', lemma='need'), Token(form='n\'t', lemma='not')],  # need not
-        'ought': [Token(form='ought', lemma='ought'), Token(form='n\'t', lemma='not')],  # ought not
-        'sha': [Token(form='sha', lemma='shall'), Token(form='n\'t', lemma='not')],  # shall not
-        'should': [Token(form='should', lemma='should'), Token(form='n\'t', lemma='not')],  # should not
-        'was': [Token(form='was', lemma='be'), Token(form='n\'t', lemma='not')],  # was not
-        'were': [Token(form='were', lemma='be'), Token(form='n\'t', lemma='not')],  # were not
-        'wo': [Token(form='wo', lemma='will'), Token(form='n\'t', lemma='not')],  # will not
-        'would': [Token(form='would', lemma='would'), Token(form='n\'t', lemma='not')],  # would not
-    },
-    'n\'ta': {
-        'should': [Token(form='should', lemma='should'), Token(form='n\'t', lemma='not'), Token(form='a', lemma='have')],  # should not have
-    },
-    'na': {
-        'gon': [Token(form='gon', lemma='go'), Token(form='na', lemma='to')],  # going to
-        'wan': [Token(form='wan', lemma='want'), Token(form='na', lemma='to')],  # want to
-    },
-    'no': {
-        'dun': [Token(form='du', lemma='do'), Token(form='n', lemma='not'), Token(form='no', lemma='know')],  # do not know
-    },
-    'not': {
-        'can': [Token(form='can', lemma='can'), Token(form='not', lemma='not')],  # can not
-    },
-    's\'': {
-        None: [Token(upos=['NOUN', 'PROPN']), Token(form='\'', lemma='\'s')],  # POS
-    },
-    'ta': {
-        'got': [Token(form='got', lemma='get'), Token(form='ta', lemma='to')],  # got to
-        'ough': [Token(form='ought', lemma='ought'), Token(form='a', lemma='to')],  # ought to
-        'out': [Token(form='out', lemma='out'), Token(form='ta', lemma='of')],  # out of
-        'sor': [Token(form='sort', lemma='sort'), Token(form='a', lemma='of')],  # sort of
-    },
-    'was': {
-        '\'t': [Token(form='\'t', lemma='it'), Token(form='was', lemma='be')],  # it was
-    },
-    'will': {
-        '\'t': [Token(form='\'t', lemma='it'), Token(form='will', lemma='will')],  # it will
-    },
-}
-
-
 def is_mwt_start(form):
     return form[-1].isalpha()
 
@@ -203,7 +25,108 @@ def is_mwt_end(form, prev_form):
     return None
 
 
+def suffix_variants(suffix):
+    # The straight quote, curly quote, and uppercase forms of the suffix, in the order they are matched.
+    upper_suffix = suffix.upper()
+    return [
+        (suffix, '\'', False),
+        (suffix.replace('\'', '’'), '’', False),
+        (upper_suffix, '\'', True),
+        (upper_suffix.replace('\'', '’'), '’', True),
+    ]
+
+
+# The expected fields of a word in a multi-word token, as (field, value) pairs. The value of
+# the form field is None, as the expected form is the `form` if it is not None, or else the
+# [form_start:form_end] slice of the multi-word token text.
+MwtPart = collections.namedtuple('MwtPart', ['fields', 'form', 'form_start', 'form_end'])
+
+
+def mwt_part_fields(part, with_form=False):
+    fields = []
+    for field, value in part.items():
+        if field == 'form':
+            value = None
+        elif isinstance(value, list):
+            value = tuple(value)
+        fields.append((field, value))
+    if with_form and 'form' not in part:
+        fields.append(('form', None))
+    return tuple(fields)
+
+
+def mwt_part_templates(parts):
+    templates = []
+    form_start = 0
+    for part in parts:
+        form_end = form_start + len(part['form'])
+        templates.append(MwtPart(mwt_part_fields(part), None, form_start, form_end))
+        form_start = form_end
+    return tuple(templates)
+
+
+def pos_part_templates(parts, quote_style, is_upper_case):
+    # The first part's form is the rest of the multi-word token text, set when it is matched.
+    suffix_form = parts[1]['form']
+    if is_upper_case:
+        suffix_form = suffix_form.upper()
+    suffix_form = suffix_form.replace('\'', quote_style)
+    templates = [
+        MwtPart(mwt_part_fields(parts[0], with_form=True), None, 0, 0),
+        MwtPart(mwt_part_fields(parts[1]), suffix_form, 0, 0),
+    ]
+    for part in parts[2:]:
+        templates.append(MwtPart(mwt_part_fields(part), part.get('form'), 0, 0))
+    return tuple(templates)
+
+
+class MwtSuffixIndex:
+    def __init__(self, mwt_suffixes):
+        # suffix variant => (priority, suffix variant, bases, lowercase bases, part of speech parts)
+        self.suffixes = {}
+        for priority, (suffix, bases) in enumerate(mwt_suffixes.items()):
+            templates = {
+                base_form: mwt_part_templates(parts) for base_form, parts in bases.items()
+                if base_form is not None
+            }
+            # The base forms matched after the exact base form, e.g. for capitalized or uppercase base forms.
+            lowercase_templates = {
+                base_form: parts for base_form, parts in templates.items()
+                if base_form == base_form.lower()
+            }
+            if 'I' in templates:  # incorrectly capitalized personal pronoun 'I'
+                lowercase_templates.setdefault('i', templates['I'])
+            for variant, quote_style, is_upper_case in suffix_variants(suffix):
+                if variant in self.suffixes:
+                    continue  # an earlier suffix or variant takes precedence
+                pos_templates = None
+                if None in bases:
+                    pos_templates = pos_part_templates(bases[None], quote_style, is_upper_case)
+                self.suffixes[variant] = (priority, variant, templates, lowercase_templates, pos_templates)
+        self.lengths = sorted({len(variant) for variant in self.suffixes})
+
+    def match(self, form):
+        # Look up the tail of the form for each suffix length, keeping the suffix that is listed first.
+        match = None
+        for length in self.lengths:
+            if length > len(form):
+                break
+            entry = self.suffixes.get(form[-length:])
+            if entry is not None and (match is None or entry[0] < match[0]):
+                match = entry
+        return match
+
+
 class MwtTokenValidator(MwtValidator):
+    name = 'mwt-tokens'
+    fields = ['form', 'deprel', 'misc']
+    rules = {
+        'mwt-continuation': LogLevel.ERROR,
+        'possible-mwt-continuation': LogLevel.WARN,
+        'mwt-space-after': LogLevel.ERROR,
+        'redundant-mwt': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
 
@@ -223,108 +146,131 @@ class MwtTokenValidator(MwtValidator):
         mwt_continuation = self.is_mwt_continuation(prev_form, token, mwt)
         if mwt_continuation == LogLevel.ERROR:
             log(mwt_continuation, sent, token,
-                f"multi-word continuation without a multi-word token range for '{prev_form}][{form}'")
+                "multi-word continuation without a multi-word token range for '{prev_form}][{form}'",
+                rule='mwt-continuation', prev_form=prev_form, form=form)
         elif mwt_continuation == LogLevel.WARN:
             log(mwt_continuation, sent, token,
-                f"possible multi-word continuation without a multi-word token range for '{prev_form}][{form}'")
+                "possible multi-word continuation without a multi-word token range for '{prev_form}][{form}'",
+                rule='possible-mwt-continuation', prev_form=prev_form, form=form)
 
     def validate_word(self, sent, token, mwt):
         if conllutil.get_misc(token, 'SpaceAfter', 'Yes') == 'No':
-            log(LogLevel.ERROR, sent, token, f"multi-word token contains a SpaceAfter=No annotation")
+            log(LogLevel.ERROR, sent, token, "multi-word token contains a SpaceAfter=No annotation",
+                rule='mwt-space-after')
 
         super().validate_word(sent, token, mwt)
 
     def validate_mwt_token(self, sent, token):
         if token['id'][0] == token['id'][2]:
-            log(LogLevel.ERROR, sent, token, f"multi-word token of length 1 is redundant")
+            log(LogLevel.ERROR, sent, token, "multi-word token of length 1 is redundant", rule='redundant-mwt')
 
 
 class MwtWordValidator(Validator):
+    name = 'mwt-words'
+    fields = ['form', 'lemma', 'upos', 'feats', 'misc']
+    rules = {
+        'extra-mwt-part': LogLevel.ERROR,
+        'mwt-part-mismatch': LogLevel.ERROR,
+        'unknown-mwt-base-form': LogLevel.ERROR,
+        'unknown-mwt-form': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
-        self.parts = []
+        rulepacks.load_rule_packs()
+        self.parts = ()
         self.part_index = -1
+        self.mwt_form = None
+        self.words = None
+        self.suffix_index = MwtSuffixIndex(mwt_suffixes)
+
+    def validate_sentence(self, sent):
+        self.words = None
+        super().validate_sentence(sent)
 
     def validate_word(self, sent, token, mwt):
         if len(self.parts) == 0:
             return
 
         if len(self.parts) == self.part_index:
-            log(LogLevel.ERROR, sent, token, f"unexpected multi-word token '{mwt['form']}' part '{token['form']}'")
+            log(LogLevel.ERROR, sent, token, "unexpected multi-word token '{mwt_form}' part '{form}'",
+                rule='extra-mwt-part', mwt_form=mwt['form'], form=token['form'])
         else:
             part = self.parts[self.part_index]
-            for field in part.keys():
-                value = token[field]
+            for field, expected in part.fields:
                 if field == 'form':
                     value = conllutil.normalized_form(token)
-
-                if isinstance(part[field], str):
-                    if value != part[field]:
-                        log(LogLevel.ERROR, sent, token,
-                            f"unexpected multi-word token '{mwt['form']}' part {field} '{value}', expected '{part[field]}'")
-                else:  # list
-                    if value not in part[field]:
-                        expected = '|'.join(part[field])
-                        log(LogLevel.ERROR, sent, token,
-                            f"unexpected multi-word token '{mwt['form']}' part {field} '{value}', expected '{expected}'")
+                    if not self.match_form(part, value):
+                        self.log_part_mismatch(sent, token, mwt, field, self.expected_form(part), value)
+                elif isinstance(expected, str):
+                    value = token[field]
+                    if value != expected:
+                        self.log_part_mismatch(sent, token, mwt, field, expected, value)
+                else:  # tuple
+                    value = token[field]
+                    if value not in expected:
+                        self.log_part_mismatch(sent, token, mwt, field, '|'.join(expected), value)
             self.part_index = self.part_index + 1
 
-    def tokenize_mwt(self, parts, form):
-        self.parts = []
-        part_offset = 0
-        for part in parts:
-            part_len = len(part['form'])
-            self.parts.append(Token(part))
-            self.parts[-1]['form'] = form[part_offset:part_offset + part_len]
-            part_offset = part_offset + part_len
-
-    def match_suffix(self, form, suffix, is_upper_case=False):
-        if form.endswith(suffix):
-            return form.replace(suffix, ''), suffix, '\'', is_upper_case
+    @staticmethod
+    def log_part_mismatch(sent, token, mwt, field, expected, value):
+        log(LogLevel.ERROR, sent, token,
+            "unexpected multi-word token '{mwt_form}' part {field} '{actual}', expected '{expect}'",
+            expect=expected, actual=value, rule='mwt-part-mismatch',
+            mwt_form=mwt['form'], field=field)
 
-        curly_suffix = suffix.replace('\'', '’')
-        if form.endswith(curly_suffix):
-            return form.replace(curly_suffix, ''), curly_suffix, '’', is_upper_case
+    def match_form(self, part, value):
+        if part.form is not None:
+            return value == part.form
+        # Compare with the slice of the multi-word token text without creating it.
+        form_len = len(self.mwt_form)
+        expected_len = min(part.form_end, form_len) - min(part.form_start, form_len)
+        if expected_len == 0:
+            return value == ''
+        return len(value) == expected_len and self.mwt_form.startswith(value, part.form_start)
 
-        if not is_upper_case:
-            return self.match_suffix(form, suffix.upper(), True)
-        return None, None, None, False
+    def expected_form(self, part):
+        if part.form is not None:
+            return part.form
+        return self.mwt_form[part.form_start:part.form_end]
 
     def mwt_text(self, sent, start_id, end_id):
-        form = ''
-        for token in sent:
-            if isinstance(token['id'], int) and token['id'] >= start_id and token['id'] <= end_id:
-                form = form + conllutil.normalized_form(token)
-        return form
+        if self.words is None:
+            # The words by ID, indexed on the first multi-word token in the sentence.
+            self.words = {token['id']: token for token in sent if isinstance(token['id'], int)}
+        forms = []
+        for word_id in range(start_id, end_id + 1):
+            token = self.words.get(word_id)
+            if token is not None:
+                forms.append(conllutil.normalized_form(token))
+        return ''.join(forms)
 
     def validate_mwt_token(self, sent, token):
         form = self.mwt_text(sent, token['id'][0], token['id'][2])
-        for suffix, bases in mwt_suffixes.items():
-            base_form, suffix, quote_style, is_upper_case = self.match_suffix(form, suffix)
-            if base_form is None:
-                continue
-
-            base_form = form.replace(suffix, '').replace('’', '\'')
-            if base_form in bases:  # lowercase
-                self.tokenize_mwt(bases[base_form], form)
-            elif base_form == 'i' and 'I' in bases:  # incorrectly capitalized personal pronoun 'I'
-                self.tokenize_mwt(bases['I'], form)
-            elif base_form.lower() in bases:  # capitalized, uppercase
-                self.tokenize_mwt(bases[base_form.lower()], form)
-            elif None in bases:  # part of speech + suffix
-                self.parts = [Token(part) for part in bases[None]]
-                if is_upper_case:
-                    self.parts[1]['form'] = self.parts[1]['form'].upper().replace('\'', quote_style)
-                else:
-                    self.parts[1]['form'] = self.parts[1]['form'].replace('\'', quote_style)
-                self.parts[0]['form'] = form.replace(self.parts[1]['form'], '')
-            else:
-                log(LogLevel.ERROR, sent, token, f"unrecognized multi-word base form '{base_form}' for suffix '{suffix}'")
-                self.parts = [Token(form=base_form), Token(form=suffix)]
-
-            self.part_index = 0
+        match = self.suffix_index.match(form)
+        if match is None:
+            log(LogLevel.ERROR, sent, token, "unrecognized multi-word token form '{form}'",
+                rule='unknown-mwt-form', form=form)
+            self.parts = ()
+            self.part_index = -1
+            self.mwt_form = None
             return
 
-        log(LogLevel.ERROR, sent, token, f"unrecognized multi-word token form '{form}'")
-        self.parts = []
-        self.index = -1
+        _, suffix, templates, lowercase_templates, pos_templates = match
+        base_form = form.replace(suffix, '').replace('’', '\'')
+        parts = templates.get(base_form)  # lowercase
+        if parts is None:  # capitalized, uppercase
+            parts = lowercase_templates.get(base_form.lower())
+
+        if parts is not None:
+            self.parts = parts
+        elif pos_templates is not None:  # part of speech + suffix
+            first_part = pos_templates[0]._replace(form=form.replace(pos_templates[1].form, ''))
+            self.parts = (first_part, *pos_templates[1:])
+        else:
+            log(LogLevel.ERROR, sent, token, "unrecognized multi-word base form '{base_form}' for suffix '{suffix}'",
+                rule='unknown-mwt-base-form', base_form=base_form, suffix=suffix)
+            self.parts = (MwtPart((('form', None),), base_form, 0, 0), MwtPart((('form', None),), suffix, 0, 0))
+
+        self.mwt_form = form
+        self.part_index = 0
@@ -1,9 +1,13 @@
 # Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
 
+from validator import conllutil
+from validator import rulepacks
 from validator.validator import Validator
 from validator.logger import log, LogLevel
+from validator.reader import TOKEN, WORD
+from validator.rulepacks import xpos_tagsets, language_xpos_tagsets
 
-upos_values = [
+upos_values = frozenset([
     '_',      # missing
     # open class words
     'ADJ',    # adjective
@@ -25,41 +29,46 @@ upos_values = [
     'PUNCT',  # punctuation
     'SYM',    # symbol
     'X',      # other
-]
-
-upenn_xpos_values = [
-    "ADD", "AFX",
-    "CC", "CD",
-    "DT",
-    "EX",
-    "FW",
-    "GW",
-    "HYPH",
-    "IN",
-    "JJ", "JJR", "JJS",
-    "LS",
-    "MD",
-    "NFP", "NN", "NNP", "NNPS", "NNS",
-    "PDT", "POS", "PRP", "PRP$",
-    "RB", "RBR", "RBS", "RP",
-    "SYM",
-    "TO",
-    "UH",
-    "VB", "VBD", "VBG", "VBN", "VBP", "VBZ",
-    "WDT", "WP", "WP$", "WRB",
-    "$", ".", ",", ":", "``", "''",
-    "-LCB-", "-RCB-", "-LRB-", "-RRB-", "-LSB-", "-RSB-",
-]
+])
 
 
 class PosTagValidator(Validator):
-    def __init__(self, language):
+    name = 'pos-tags'
+    fields = ['upos', 'xpos']
+    rules = {
+        'unknown-upos': LogLevel.ERROR,
+        'unknown-xpos': LogLevel.ERROR,
+    }
+
+    def __init__(self, language, xpos_tagset=None):
         super().__init__(language)
+        rulepacks.load_rule_packs()
+        self.xpos_tagset = xpos_tagset  # The XPOS tagset of all the languages, or None to use the rule packs.
+        self.xpos_values = None  # The XPOS tagset of the language, or None if it is not checked.
+        self.switch_language(language)
+
+    def switch_language(self, language):
+        super().switch_language(language)
+        if self.xpos_tagset is None:
+            self.xpos_values = xpos_tagsets.get(language_xpos_tagsets.get(language))
+        else:
+            self.xpos_values = xpos_tagsets[self.xpos_tagset]
 
-    def validate_token(self, sent, token):
-        upos = token['upos']
-        xpos = token['xpos']
-        if upos not in upos_values:
-            log(LogLevel.ERROR, sent, token, f"unknown UPOS value '{upos}'")
-        if self.language == 'en' and xpos not in upenn_xpos_values:
-            log(LogLevel.ERROR, sent, token, f"unknown XPOS value '{xpos}'")
+    def validate_sentence(self, sent):
+        # Check the sentence's tags as a batch, and only look at the tokens with unknown tags.
+        unknown_upos = set(conllutil.word_values(sent, 'upos')).difference(upos_values)
+        if self.xpos_values is None:
+            unknown_xpos = ()
+        else:
+            unknown_xpos = set(conllutil.word_values(sent, 'xpos')).difference(self.xpos_values)
+        if len(unknown_upos) == 0 and len(unknown_xpos) == 0:
+            return
+        for kind, token, _ in conllutil.token_sequence(sent):
+            if kind != TOKEN and kind != WORD:
+                continue
+            upos = token['upos']
+            xpos = token['xpos']
+            if upos in unknown_upos:
+                log(LogLevel.ERROR, sent, token, "unknown UPOS value '{actual}'", actual=upos, rule='unknown-upos')
+            if xpos in unknown_xpos:
+                log(LogLevel.ERROR, sent, token, "unknown XPOS value '{actual}'", actual=xpos, rule='unknown-xpos')
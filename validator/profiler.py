@@ -0,0 +1,128 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import contextlib
+import importlib
+import json
+import sys
+import time
+
+validator_hooks = [
+    'validate_sentence',
+    'validate_token',
+    'validate_word',
+    'validate_mwt_token',
+    'validate_empty_node',
+]
+
+# The rule tables that are instrumented, keyed by the group name used in the report. These
+# are (module, table) names, so the validator modules are only instrumented when imported.
+rule_tables = {
+    'lemma-rule': ('validator.lemma', 'lemmatization_rules'),
+    'num-format': ('validator.form', 'num_formats'),
+}
+
+
+def loaded_rule_tables():
+    tables = {}
+    for group, (module_name, table_name) in rule_tables.items():
+        module = sys.modules.get(module_name)
+        if module is not None:
+            tables[group] = getattr(module, table_name)
+    return tables
+
+
+class Profiler:
+    def __init__(self):
+        self.entries = {}  # (group, name) => [number of calls, cumulative time in nanoseconds]
+        self.validators = []
+        self.cache_counts = {}  # validator name => (cache hits, cache misses) already in the entries
+
+    def timed(self, key, function):
+        entry = self.entries.setdefault(key, [0, 0])
+        clock = time.perf_counter_ns
+
+        def timed_function(*args):
+            start = clock()
+            result = function(*args)
+            entry[1] += clock() - start
+            entry[0] += 1
+            return result
+        return timed_function
+
+    def instrument_validator(self, validator):
+        # The hooks are replaced on the instance, so the calls from the base class are also timed.
+        for hook in validator_hooks:
+            setattr(validator, hook, self.timed((validator.name, hook), getattr(validator, hook)))
+        self.validators.append(validator)
+
+    def update_cache_entries(self):
+        # The cache hits and misses of the validators with a cache, e.g. the expected lemmas.
+        for validator in self.validators:
+            if hasattr(validator, 'cache_info'):
+                info = validator.cache_info()
+                hits, misses = self.cache_counts.get(validator.name, (0, 0))
+                self.entries.setdefault((validator.name, 'cache hits'), [0, 0])[0] += info.hits - hits
+                self.entries.setdefault((validator.name, 'cache misses'), [0, 0])[0] += info.misses - misses
+                self.cache_counts[validator.name] = (info.hits, info.misses)
+
+    def import_module(self, module_name):
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        return self.timed(('startup', module_name), importlib.import_module)(module_name)
+
+    @contextlib.contextmanager
+    def instrument_rules(self):
+        tables = loaded_rule_tables()
+        originals = {group: dict(table) for group, table in tables.items()}
+        for group, table in tables.items():
+            for name, function in originals[group].items():
+                table[name] = self.timed((group, name), function)
+        try:
+            yield self
+        finally:
+            for group, table in tables.items():
+                table.update(originals[group])
+
+    def stats(self):
+        # The entries since the last call, so the stats of a worker can be merged after each job.
+        self.update_cache_entries()
+        stats = {key: list(entry) for key, entry in self.entries.items() if entry[0] != 0}
+        for entry in self.entries.values():
+            entry[0] = 0
+            entry[1] = 0
+        return stats
+
+    def merge(self, stats):
+        for key, (calls, total) in stats.items():
+            entry = self.entries.setdefault(key, [0, 0])
+            entry[0] += calls
+            entry[1] += total
+
+    def report(self):
+        self.update_cache_entries()
+        report = []
+        for (group, name), (calls, total) in sorted(self.entries.items(), key=lambda item: -item[1][1]):
+            if calls == 0:
+                continue
+            report.append({
+                'group': group,
+                'name': name,
+                'calls': calls,
+                'seconds': total / 1e9,
+            })
+        return report
+
+    def write_summary(self, stream):
+        report = self.report()
+        stream.write(f"{'group':<16} {'name':<40} {'calls':>10} {'total (s)':>10} {'per call (us)':>14}\n")
+        for entry in report:
+            per_call = entry['seconds'] * 1e6 / entry['calls']
+            stream.write(f"{entry['group']:<16} {entry['name']:<40} {entry['calls']:>10} "
+                         f"{entry['seconds']:>10.3f} {per_call:>14.2f}\n")
+        if any(entry['group'] == 'lemma-rule' for entry in report):
+            stream.write("The lemma-rule calls are the lemma cache misses, as the cached lemmas do not call the rules.\n")
+
+    def write_json(self, filename):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+            f.write('\n')
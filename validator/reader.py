@@ -0,0 +1,360 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import mmap
+import os
+import re
+from array import array
+from sys import intern
+
+from conllu.exceptions import ParseException
+from conllu.parser import parse_dict_value, parse_id_value, parse_int_value, parse_paired_list_value
+
+from validator.logger import Diagnostic, LogLevel, get_context
+
+FIELDS = ('id', 'form', 'lemma', 'upos', 'xpos', 'feats', 'head', 'deprel', 'deps', 'misc')
+
+FIELD_INDEX = {field: index for index, field in enumerate(FIELDS)}
+
+# Fields that are stored as interned strings when they are decoded.
+STRING_FIELDS = ('form', 'lemma', 'upos', 'xpos', 'deprel')
+
+# The kind of each token in a sentence, used to dispatch to the validate_* methods.
+TOKEN = 0  # token, or a word that is not part of a multi-word token
+WORD = 1  # word in a multi-word token
+MWT = 2  # multi-word token
+EMPTY_NODE = 3
+
+# Metadata keys that are kept when they don't have a value.
+METADATA_FLAGS = ['newdoc', 'newpar']
+
+RE_BLANK_LINES = re.compile(rb'\n(?:[ \t\r]*\n)+')
+
+# The conllu library also accepts fields separated by two or more spaces.
+RE_FIELD_SEPARATOR = re.compile(r'\t| {2,}')
+
+# The multi-word token (1-2) and empty node (1.1) IDs. Only ASCII digits are valid, as in
+# the conllu library, but str.isdigit and int also accept other digits such as '²'.
+RE_ID_RANGE = re.compile(r'([0-9]+)([-.])([0-9]+)')
+
+# The rules for the lines the reader skips, reported as the 'reader' validator.
+rules = {
+    'invalid-line': LogLevel.ERROR,
+}
+
+
+def parse_ids(values):
+    starts = array('i')
+    ends = array('i')
+    kinds = bytearray()
+    mwt_end = 0
+    for value in values:
+        if value.isascii() and value.isdigit():
+            start = end = int(value)
+            kinds.append(WORD if start <= mwt_end else TOKEN)
+        elif value == '_' or value == '':
+            start = end = -1
+            kinds.append(TOKEN)
+        else:
+            match = RE_ID_RANGE.fullmatch(value)
+            if match is None:
+                raise ValueError(f"'{value}' is not a valid ID.")
+            start, end = int(match.group(1)), int(match.group(3))
+            if match.group(2) == '-':
+                kinds.append(MWT)
+                mwt_end = end
+            else:
+                kinds.append(EMPTY_NODE)
+        starts.append(start)
+        ends.append(end)
+    return starts, ends, kinds
+
+
+def parse_str(value):
+    return value
+
+
+def parse_nullable(value):
+    if value == '_' or value == '':
+        return None
+    return value
+
+
+field_parsers = {
+    'form': parse_str,
+    'lemma': parse_str,
+    'upos': parse_str,
+    'xpos': parse_nullable,
+    'deprel': parse_str,
+    'head': parse_int_value,
+    'feats': parse_dict_value,
+    'deps': parse_paired_list_value,
+    'misc': parse_dict_value,
+}
+
+
+class Token(dict):
+    # A view of a row of the sentence. The lazy fields are only added to the dict when they
+    # are accessed, so `'feats' in token` is False until then. Use `token['feats']` to
+    # check them.
+    __slots__ = ('sentence', 'index')
+
+    def __missing__(self, field):
+        value = self.sentence.value(field, self.index)
+        self[field] = value
+        return value
+
+
+class Sentence:
+    __slots__ = ('metadata', 'id_starts', 'id_ends', 'kinds',
+                 'form', 'lemma', 'upos', 'xpos', 'deprel',  # interned strings
+                 'feats', 'head', 'deps', 'misc',  # unparsed strings
+                 'decoded_fields', 'tokens')
+
+    def __init__(self, rows, metadata, decoded_fields=STRING_FIELDS):
+        self.metadata = metadata
+        columns = list(zip(*rows)) if len(rows) != 0 else [()] * len(FIELDS)
+        self.id_starts, self.id_ends, self.kinds = parse_ids(columns[0])
+        self.form = list(map(intern, columns[1]))
+        self.lemma = list(map(intern, columns[2]))
+        self.upos = list(map(intern, columns[3]))
+        self.xpos = [None if xpos == '_' or xpos == '' else intern(xpos) for xpos in columns[4]]
+        self.feats = columns[5]
+        self.head = columns[6]
+        self.deprel = list(map(intern, columns[7]))
+        self.deps = columns[8]
+        self.misc = columns[9]
+        self.decoded_fields = decoded_fields
+        self.tokens = None  # The token views, created when they are first used.
+
+    @staticmethod
+    def from_bytes(rows, metadata, fields):
+        # Only the string fields listed in `fields` are decoded. The other fields are
+        # kept as bytes, and are decoded by the token when they are accessed.
+        sent = Sentence.__new__(Sentence)
+        sent.metadata = metadata
+        columns = list(zip(*rows)) if len(rows) != 0 else [()] * len(FIELDS)
+        sent.id_starts, sent.id_ends, sent.kinds = parse_ids([value.decode('utf-8') for value in columns[0]])
+        for field in STRING_FIELDS:
+            column = columns[FIELD_INDEX[field]]
+            if field not in fields:
+                setattr(sent, field, column)
+            elif field == 'xpos':
+                sent.xpos = [None if xpos == b'_' or xpos == b'' else intern(xpos.decode('utf-8')) for xpos in column]
+            else:
+                setattr(sent, field, [intern(value.decode('utf-8')) for value in column])
+        sent.feats = columns[5]
+        sent.head = columns[6]
+        sent.deps = columns[8]
+        sent.misc = columns[9]
+        sent.decoded_fields = tuple(field for field in STRING_FIELDS if field in fields)
+        sent.tokens = None
+        return sent
+
+    def token_id(self, index):
+        kind = self.kinds[index]
+        if kind == MWT:
+            return self.id_starts[index], '-', self.id_ends[index]
+        if kind == EMPTY_NODE:
+            return self.id_starts[index], '.', self.id_ends[index]
+        start = self.id_starts[index]
+        return None if start < 0 else start  # '_' IDs are None, as in the conllu library
+
+    def value(self, field, index):
+        parser = field_parsers.get(field)
+        if parser is None:
+            raise KeyError(field)
+        value = getattr(self, field)[index]
+        if type(value) is bytes:  # not decoded by the mmap reader
+            value = value.decode('utf-8')
+        return parser(value)
+
+    def token(self, index):
+        if self.tokens is None:
+            self.tokens = [None] * len(self.kinds)
+        token = self.tokens[index]
+        if token is not None:
+            return token
+        # The decoded string fields are references to the interned column values.
+        if self.decoded_fields is STRING_FIELDS:
+            token = Token(id=self.token_id(index),
+                          form=self.form[index],
+                          lemma=self.lemma[index],
+                          upos=self.upos[index],
+                          xpos=self.xpos[index],
+                          deprel=self.deprel[index])
+        else:
+            token = Token(id=self.token_id(index))
+            for field in self.decoded_fields:
+                token[field] = getattr(self, field)[index]
+        token.sentence = self
+        token.index = index
+        self.tokens[index] = token
+        return token
+
+    def token_sequence(self):
+        # Dispatch over the token kinds, creating the token views as they are used.
+        mwt = None
+        for index, kind in enumerate(self.kinds):
+            token = self.token(index)
+            if kind == MWT:
+                mwt = token
+            yield kind, token, mwt if kind == WORD else None
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.kinds)
+        if index < 0 or index >= len(self.kinds):
+            raise IndexError('sentence index out of range')
+        return self.token(index)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield self.token(index)
+
+
+def parse_comment(line, metadata):
+    key, sep, value = line[1:].partition('=')
+    key = key.strip()
+    if sep:
+        value = value.strip()
+        if key != '' and value != '':
+            metadata[key] = value
+        elif key in METADATA_FLAGS:
+            metadata[key] = value
+    elif key in METADATA_FLAGS:
+        metadata[key] = None
+
+
+def is_valid_id(value):
+    # The IDs accepted by both parse_ids and the conllu library.
+    if value.isascii() and value.isdigit():
+        return True
+    try:
+        parse_id_value(value)
+    except ParseException:
+        return False
+    return True
+
+
+def log_invalid_line(metadata, line, message):
+    context = get_context()
+    if context.enabled(LogLevel.ERROR, 'invalid-line'):
+        context.emit(Diagnostic(LogLevel.ERROR, metadata.get('sent_id'), None, 'reader', 'invalid-line',
+                                message, actual=line))
+
+
+def split_line(line, metadata):
+    # Accept the lines the conllu library accepts: the missing fields are '_', and the
+    # extra fields are ignored.
+    columns = line.split('\t')
+    if len(columns) == len(FIELDS):
+        return columns
+    columns = RE_FIELD_SEPARATOR.split(line.strip())
+    if len(columns) == 1:
+        log_invalid_line(metadata, line, "skipped line without tab-separated fields: '{actual}'")
+        return None
+    if len(columns) > len(FIELDS):
+        return columns[:len(FIELDS)]
+    return columns + ['_'] * (len(FIELDS) - len(columns))
+
+
+def create_sentence(rows, metadata, create):
+    try:
+        return create(rows, metadata)
+    except ValueError:  # an invalid ID
+        pass
+    valid_rows = []
+    for row in rows:
+        value = row[0] if type(row[0]) is str else row[0].decode('utf-8')
+        if is_valid_id(value):
+            valid_rows.append(row)
+        else:
+            log_invalid_line(metadata, value, "skipped line with an invalid ID '{actual}'")
+    return create(valid_rows, metadata)
+
+
+def parse_lines(lines):
+    rows = []
+    metadata = {}
+    in_sentence = False
+    for line in lines:
+        line = line.rstrip('\r\n')  # the last field can be empty, so keep the tabs
+        if line == '' or line.isspace():
+            if in_sentence:
+                yield create_sentence(rows, metadata, Sentence)
+                rows = []
+                metadata = {}
+                in_sentence = False
+            continue
+        in_sentence = True
+        if line[0] == '#':
+            parse_comment(line.strip(), metadata)
+        else:
+            columns = split_line(line, metadata)
+            if columns is not None:
+                rows.append(columns)
+    if in_sentence:
+        yield create_sentence(rows, metadata, Sentence)
+
+
+def parse_conllu(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        for sent in parse_lines(f):
+            yield sent
+
+
+def parse_block(block, fields):
+    rows = []
+    metadata = {}
+    in_sentence = False
+    for line in block.split(b'\n'):
+        line = line.rstrip(b'\r')  # the last field can be empty, so keep the tabs
+        if line == b'' or line.isspace():
+            continue
+        in_sentence = True
+        if line[0] == 0x23:  # '#'
+            parse_comment(line.decode('utf-8').strip(), metadata)
+        else:
+            columns = line.split(b'\t')
+            if len(columns) != len(FIELDS):
+                columns = split_line(line.decode('utf-8'), metadata)
+                if columns is None:
+                    continue
+                columns = [column.encode('utf-8') for column in columns]
+            rows.append(columns)
+    if in_sentence:
+        return create_sentence(rows, metadata, lambda rows, metadata: Sentence.from_bytes(rows, metadata, fields))
+    return None
+
+
+def parse_conllu_mmap(filename, fields=FIELDS):
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap does not support empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < len(data):
+                match = RE_BLANK_LINES.search(data, start)
+                end, next_start = (match.start(), match.end()) if match else (len(data), len(data))
+                sent = parse_block(data[start:end], fields)
+                if sent is not None:
+                    yield sent
+                start = next_start
+
+
+def parse_sentence_block(block):
+    for sent in parse_lines(block.split('\n')):
+        return sent
+    return Sentence([], {})
+
+
+def parse_metadata(block):
+    metadata = {}
+    for line in block.split('\n'):
+        line = line.strip()
+        if line.startswith('#'):
+            parse_comment(line, metadata)
+    return metadata
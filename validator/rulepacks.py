@@ -0,0 +1,237 @@
+# Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import pickle
+
+
+data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+builtin_rule_packs = [
+    os.path.join(data_dir, 'contractions.toml'),
+    os.path.join(data_dir, 'lemma.toml'),
+    os.path.join(data_dir, 'mwt.toml'),
+    os.path.join(data_dir, 'pos.toml'),
+]
+
+CACHE_VERSION = 4
+
+# The rule tables. These are updated in place when the rule packs are loaded, so the
+# validator modules can import them directly.
+dialectal_contractions = {}  # contraction => words
+contraction_splits = {}  # first form => frozenset(second forms), lowercase
+lemmatization_rule_names = {}  # lemma type => lemmatization rule name
+lemma_exceptions = {}  # lemma type => {normalized form => lemma}
+lemma_exception_index = {}  # (lemma type, normalized form) => (lemma exception table, lemma)
+mwt_suffixes = {}  # suffix => {base form => [word fields]}
+xpos_tagsets = {}  # tagset name => frozenset(XPOS values)
+language_xpos_tagsets = {}  # language => tagset name
+
+loaded_sources = None
+
+
+def load_rule_pack(filename):
+    # The TOML parser is only imported when the rule cache is out of date.
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+    with open(filename, 'rb') as f:
+        return tomllib.load(f)
+
+
+def build_lemma_exception_index(lemma_exceptions):
+    # (lemma type, normalized form) => (lemma exception table, lemma)
+    index = {}
+    for form, lemma in lemma_exceptions.get('VBD', {}).items():
+        index[('VBN', form)] = ('VBD', lemma)  # use VBD for other VBN lemma exceptions
+    for lemma_type, exceptions in lemma_exceptions.items():
+        for form, lemma in exceptions.items():
+            index[(lemma_type, form)] = (lemma_type, lemma)
+    return index
+
+
+def apostrophe_variants(form):
+    variants = ['']
+    for c in form:
+        if c == '\'':
+            variants = [variant + apostrophe for variant in variants for apostrophe in ['\'', '’']]
+        else:
+            variants = [variant + c for variant in variants]
+    return variants
+
+
+def build_contraction_split_index(dialectal_contractions):
+    # The ways the contractions can be split into a pair of forms, so a pair can be checked
+    # without joining the forms. The apostrophes can be straight or curly in either form.
+    index = {}
+    for contraction in dialectal_contractions:
+        contraction = contraction.lower().replace('’', '\'')
+        if '\'' not in contraction:
+            continue
+        for variant in apostrophe_variants(contraction):
+            for i in range(len(variant) + 1):
+                index.setdefault(variant[:i], set()).add(variant[i:])
+    return {first_form: frozenset(second_forms) for first_form, second_forms in index.items()}
+
+
+def compile_rules(filenames):
+    # The later rule packs add to, or replace the entries of, the earlier rule packs.
+    tables = {
+        'dialectal_contractions': {},
+        'lemmatization_rule_names': {},
+        'lemma_exceptions': {},
+        'mwt_suffixes': {},
+        'xpos_tagsets': {},
+        'language_xpos_tagsets': {},
+    }
+    for filename in filenames:
+        pack = load_rule_pack(filename)
+        tables['dialectal_contractions'].update(pack.get('dialectal-contractions', {}))
+        tables['lemmatization_rule_names'].update(pack.get('lemmatization-rules', {}))
+        for lemma_type, exceptions in pack.get('lemma-exceptions', {}).items():
+            tables['lemma_exceptions'].setdefault(lemma_type, {}).update(exceptions)
+        for suffix, bases in pack.get('mwt-suffixes', {}).items():
+            suffix_bases = tables['mwt_suffixes'].setdefault(suffix, {})
+            for base_form, parts in bases.items():
+                suffix_bases[None if base_form == '*' else base_form] = parts
+        for name, tags in pack.get('xpos-tagsets', {}).items():
+            tables['xpos_tagsets'][name] = frozenset(tags)
+        tables['language_xpos_tagsets'].update(pack.get('language-xpos-tagsets', {}))
+    tables['contraction_splits'] = build_contraction_split_index(tables['dialectal_contractions'])
+    tables['lemma_exception_index'] = build_lemma_exception_index(tables['lemma_exceptions'])
+    return tables
+
+
+def rule_pack_sources(filenames):
+    sources = []
+    for filename in filenames:
+        stat = os.stat(filename)
+        sources.append((os.path.abspath(filename), stat.st_mtime_ns, stat.st_size))
+    return sources
+
+
+def user_cache_dir():
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'conllu-en-validator')
+
+
+def installed_cache_filename():
+    # Only written by `python -m validator.rulepacks`, e.g. when the validator is installed.
+    return os.path.join(data_dir, 'compiled.pickle')
+
+
+def user_cache_filename(filenames):
+    # The rule cache written when the rule packs are used, in the user's cache directory.
+    if list(filenames) == builtin_rule_packs:
+        return os.path.join(user_cache_dir(), 'compiled.pickle')
+    import hashlib
+    key = '\n'.join(os.path.abspath(filename) for filename in filenames)
+    return os.path.join(user_cache_dir(), f"compiled-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.pickle")
+
+
+def cache_filenames(filenames):
+    # The rule caches to read, in order.
+    if list(filenames) == builtin_rule_packs:
+        return [installed_cache_filename(), user_cache_filename(filenames)]
+    return [user_cache_filename(filenames)]
+
+
+def is_trusted_cache(stat):
+    # The cache is unpickled, which can run code, so only use the caches written by the user
+    # or by root (e.g. when installed) that other users cannot modify.
+    if not hasattr(os, 'getuid'):
+        return True
+    return stat.st_uid in (os.getuid(), 0) and stat.st_mode & 0o022 == 0
+
+
+def read_cache(filename, sources):
+    # The cache version and rule pack sources are in a JSON header line, so an out of date
+    # cache is not unpickled.
+    try:
+        with open(filename, 'rb') as f:
+            if not is_trusted_cache(os.fstat(f.fileno())):
+                return None
+            header = json.loads(f.readline())
+            if header.get('version') != CACHE_VERSION or header.get('sources') != [list(source) for source in sources]:
+                return None  # out of date
+            return pickle.load(f)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def write_cache(filename, sources, tables):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    # Write to a temporary file first, so parallel runs do not read a partial cache.
+    temp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(temp_filename, 'wb') as f:
+        f.write(json.dumps({'version': CACHE_VERSION, 'sources': sources}).encode('utf-8') + b'\n')
+        pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_filename, filename)
+
+
+def load_rules(filenames, cache=None):
+    sources = rule_pack_sources(filenames)
+    for filename in (cache_filenames(filenames) if cache is None else [cache]):
+        tables = read_cache(filename, sources)
+        if tables is not None:
+            return tables, sources
+    tables = compile_rules(filenames)
+    try:
+        write_cache(user_cache_filename(filenames) if cache is None else cache, sources, tables)
+    except OSError:
+        pass  # e.g. a read-only home directory; the rule packs are compiled each time
+    return tables, sources
+
+
+def use_rule_packs(filenames=(), cache=None):
+    global loaded_sources
+    filenames = builtin_rule_packs + list(filenames)
+    sources = rule_pack_sources(filenames)
+    if sources == loaded_sources:
+        return
+    tables, loaded_sources = load_rules(filenames, cache)
+    for table, values in [
+        (dialectal_contractions, tables['dialectal_contractions']),
+        (contraction_splits, tables['contraction_splits']),
+        (lemmatization_rule_names, tables['lemmatization_rule_names']),
+        (lemma_exceptions, tables['lemma_exceptions']),
+        (lemma_exception_index, tables['lemma_exception_index']),
+        (mwt_suffixes, tables['mwt_suffixes']),
+        (xpos_tagsets, tables['xpos_tagsets']),
+        (language_xpos_tagsets, tables['language_xpos_tagsets']),
+    ]:
+        table.clear()
+        table.update(values)
+
+
+def load_rule_packs():
+    # Used by the validators, so the rule packs are loaded once: either the rule packs
+    # selected with use_rule_packs, or the built-in rule packs.
+    if loaded_sources is None:
+        use_rule_packs()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Compile the rule packs into the rule cache.')
+    parser.add_argument('rules', nargs='*',
+                        help='The project-specific rule packs to add to the built-in rule packs.')
+    parser.add_argument('--cache', default=None, type=str,
+                        help='The rule cache file to write.')
+    args = parser.parse_args()
+
+    # The built-in rule cache is written to the install, and the others to the user's cache.
+    filenames = builtin_rule_packs + args.rules
+    if args.cache is not None:
+        cache = args.cache
+    elif len(args.rules) == 0:
+        cache = installed_cache_filename()
+    else:
+        cache = user_cache_filename(filenames)
+    write_cache(cache, rule_pack_sources(filenames), compile_rules(filenames))
+    print(cache)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,67 +5,128 @@ from validator.validator import Validator
 from validator.logger import log, LogLevel
 
 
+class TextMatcher:
+    # Matches the token or word stream against the sentence text as it is read, keeping the
+    # offset of the first mismatch and the stream text after it instead of the whole stream.
+    def __init__(self, text, context_size=20):
+        self.text = text
+        self.context_size = context_size
+        self.offset = 0
+        self.mismatch = None  # The offset of the first character that does not match.
+        self.actual = []  # The stream text from the mismatch, up to the context size.
+        self.actual_len = 0
+
+    def append(self, span):
+        if self.mismatch is None:
+            if self.text.startswith(span, self.offset):
+                self.offset = self.offset + len(span)
+                return
+            end = min(len(span), len(self.text) - self.offset)
+            index = 0
+            while index < end and span[index] == self.text[self.offset + index]:
+                index = index + 1
+            self.mismatch = self.offset + index
+            span = span[index:]
+        if self.actual_len < self.context_size:
+            self.actual.append(span)
+            self.actual_len = self.actual_len + len(span)
+
+    def finish(self):
+        if self.mismatch is None and self.offset != len(self.text):
+            self.mismatch = self.offset  # the text is longer than the stream
+        return self.mismatch
+
+    def expect_context(self):
+        start = max(self.mismatch - self.context_size, 0)
+        return self.text[start:self.mismatch + self.context_size]
+
+    def actual_context(self):
+        start = max(self.mismatch - self.context_size, 0)
+        return self.text[start:self.mismatch] + ''.join(self.actual)[:self.context_size]
+
+
 class SentenceTextValidator(Validator):
+    name = 'sentence-text'
+    fields = ['form', 'misc']
+    rules = {
+        'token-text-mismatch': LogLevel.ERROR,
+        'word-text-mismatch': LogLevel.ERROR,
+        'missing-text': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
-        self.token_text = ""
-        self.word_text = ""
+        self.token_text = None
+        self.word_text = None
         self.need_space = False
 
     def validate_sentence(self, sent):
-        self.token_text = ""
-        self.word_text = ""
+        if 'text' not in sent.metadata:
+            log(LogLevel.ERROR, sent, None, "sentence text is missing", rule='missing-text')
+            return
+
+        self.token_text = TextMatcher(sent.metadata['text'])
+        self.word_text = TextMatcher(sent.metadata['text'])
         self.need_space = False
         super().validate_sentence(sent)
 
-        if 'text' in sent.metadata:
-            if self.token_text != sent.metadata['text']:
-                log(LogLevel.ERROR, sent, None, "text does not match the token sequence",
-                    expect=sent.metadata['text'],
-                    actual=self.token_text)
-            if self.language == 'en' and self.word_text != sent.metadata['text']:
-                log(LogLevel.ERROR, sent, None, "text does not match the word sequence",
-                    expect=sent.metadata['text'],
-                    actual=self.word_text)
-        else:
-            log(LogLevel.ERROR, sent, None, "sentence text is missing")
+        if self.token_text.finish() is not None:
+            log(LogLevel.ERROR, sent, None, "text does not match the token sequence at offset {offset}",
+                expect=self.token_text.expect_context(),
+                actual=self.token_text.actual_context(),
+                rule='token-text-mismatch', offset=self.token_text.mismatch)
+        if self.language == 'en' and self.word_text.finish() is not None:
+            log(LogLevel.ERROR, sent, None, "text does not match the word sequence at offset {offset}",
+                expect=self.word_text.expect_context(),
+                actual=self.word_text.actual_context(),
+                rule='word-text-mismatch', offset=self.word_text.mismatch)
 
     def validate_word(self, sent, token, mwt):
         if self.need_space:
-            self.token_text += " "
-            self.word_text += " "
+            self.token_text.append(" ")
+            self.word_text.append(" ")
         if mwt['id'][2] == token['id']:
             self.need_space = conllutil.get_misc(mwt, 'SpaceAfter', 'Yes') == 'Yes'
         else:
             self.need_space = False
-        self.word_text += token['form']
+        self.word_text.append(token['form'])
 
     def validate_token(self, sent, token):
         if self.need_space:
-            self.token_text += " "
-            self.word_text += " "
+            self.token_text.append(" ")
+            self.word_text.append(" ")
         self.need_space = conllutil.get_misc(token, 'SpaceAfter', 'Yes') == 'Yes'
-        self.token_text += token['form']
-        self.word_text += token['form']
+        self.token_text.append(token['form'])
+        self.word_text.append(token['form'])
 
     def validate_mwt_token(self, sent, token):
         if self.need_space:
-            self.token_text += " "
-            self.word_text += " "
+            self.token_text.append(" ")
+            self.word_text.append(" ")
             self.need_space = False
-        self.token_text += token['form']
+        self.token_text.append(token['form'])
 
 
 class SplitSentenceValidator(Validator):
+    name = 'split-sentences'
+    fields = ['upos']
+    rules = {
+        'missing-final-punct': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
         self.prev_sent = None
 
+    def set_previous_sentence(self, sent):
+        self.prev_sent = sent
+
     def validate_sentence(self, sent):
         if self.prev_sent is not None:
             etok = self.prev_sent[-1]
             if etok['upos'] not in ['PUNCT']:
                 if 'newpar' not in sent.metadata and 'newpar id' not in sent.metadata:
                     log(LogLevel.ERROR, sent, None,
-                        f"sentence ends without punctuation or new paragraph metadata")
+                        "sentence ends without punctuation or new paragraph metadata",
+                        rule='missing-final-punct')
         self.prev_sent = sent
@@ -15,6 +15,12 @@ abbreviations = [
 
 
 class AbbreviationValidator(Validator):
+    name = 'abbreviations'
+    fields = ['form', 'upos']
+    rules = {
+        'split-abbreviation': LogLevel.ERROR,
+    }
+
     def __init__(self, language):
         super().__init__(language)
         self.prev_token = None
@@ -26,7 +32,8 @@ class AbbreviationValidator(Validator):
     def validate_before_full_stop(self, sent, token):
         form = token['form']
         if form in abbreviations:
-            log(LogLevel.ERROR, sent, token, f"abbreviation '{form}.' should be a single token")
+            log(LogLevel.ERROR, sent, token, "abbreviation '{form}.' should be a single token",
+                rule='split-abbreviation', form=form)
 
     def validate_token(self, sent, token):
         upos = token['upos']
@@ -1,31 +1,39 @@
 # Copyright (C) 2023 Reece H. Dunn. SPDX-License-Identifier: Apache-2.0
 
 from validator import conllutil
+from validator.reader import FIELDS, TOKEN, WORD, MWT
 
 
 class Validator:
+    name = None  # The name used to select the validator, and to report its diagnostics.
+    fields = FIELDS  # The token fields the validator uses.
+    rules = {}  # The rules the validator checks, and the level they are reported at.
+
     def __init__(self, language):
         self.language = language
 
+    @classmethod
+    def is_enabled(cls, log_filter):
+        if len(cls.rules) == 0:
+            return True
+        return any(log_filter.enabled(level, rule) for rule, level in cls.rules.items())
+
     def switch_language(self, language):
         self.language = language
 
+    def set_previous_sentence(self, sent):
+        pass  # Used when the sentences are validated in batches.
+
     def validate_sentence(self, sent):
-        mwt = None
-        for token in sent:
-            if type(token['id']) is int:  # token, word
-                if mwt is not None:
-                    if mwt['id'][2] >= token['id']:
-                        self.validate_word(sent, token, mwt)
-                    else:
-                        self.validate_token(sent, token)
-                else:
-                    self.validate_token(sent, token)
-            elif '.' in token['id']:  # empty node
-                self.validate_empty_node(sent, token)
-            else:  # multi-word token
-                mwt = token
+        for kind, token, mwt in conllutil.token_sequence(sent):
+            if kind == TOKEN:
+                self.validate_token(sent, token)
+            elif kind == WORD:
+                self.validate_word(sent, token, mwt)
+            elif kind == MWT:
                 self.validate_mwt_token(sent, token)
+            else:  # empty node
+                self.validate_empty_node(sent, token)
 
     def validate_token(self, sent, token):
         pass
@@ -41,6 +49,8 @@ class Validator:
 
 
 class MwtValidator(Validator):
+    fields = ['form', 'misc']
+
     def __init__(self, language):
         super().__init__(language)
         self.prev_token = None